@@ -18,12 +18,53 @@
 # Temple Place, Suite 330, Boston, MA 02111-1307 USA                          #
 ###############################################################################
 
+import codecs
+import collections
+import functools
+import itertools
 import os
+import posixpath
 import struct
+import threading
+from array import array
 import zlib
-import chardet
 
-from .books import BibleStructure
+from .books import get_structure
+from .cache import CachedText, LRUCache
+from .files import FileReader, MmapReader, open_zip_member
+from .filters import MarkupFilter
+from .search import LemmaIndex, SearchIndex
+
+
+# A verse with its reference, as returned by SwordBible.getiter_verses
+Verse = collections.namedtuple('Verse', ['book', 'chapter', 'verse', 'text'])
+
+# Distinguishes the bibles sharing a text cache
+_bible_ids = itertools.count()
+
+
+_decompress_executor = None
+_decompress_executor_lock = threading.Lock()
+
+
+def decompress_executor():
+    '''Returns the thread pool shared by the bibles loading blocks in the background (see SwordBible), with
+    a thread per CPU. It is created when first needed.
+    '''
+    global _decompress_executor
+    with _decompress_executor_lock:
+        if _decompress_executor is None:
+            # Imported here, as only bibles loading blocks in the background need it
+            from concurrent.futures import ThreadPoolExecutor
+            _decompress_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                                      thread_name_prefix='pysword-decompress')
+        return _decompress_executor
+
+
+def _ends_of_runs(indicies):
+    '''Yields for each index whether it is the last one of a run of consecutive indicies.'''
+    for pos, index in enumerate(indicies):
+        yield pos + 1 == len(indicies) or indicies[pos+1] != index + 1
 
 
 class SwordModuleType:
@@ -35,15 +76,58 @@ class SwordModuleType:
 
 class SwordBible(object):
 
-    def __init__(self, module_path, module_type=SwordModuleType.ZTEXT, versification='default'):
-        self.__structure = BibleStructure(versification)
+    def __init__(self, module_path, module_type=SwordModuleType.ZTEXT, versification='default',
+                 block_cache_size=32, block_cache_bytes=8*1024*1024, use_mmap=False, zip_file=None,
+                 encoding=None, file_pool=None, preload=False, decompress_workers=0,
+                 readahead=None, text_cache=None, executor=None):
+        '''Open the module in module_path. If zip_file, an open zipfile.ZipFile, is given, module_path
+        is the path of the module inside the zipfile and the module is read directly from it.
+        The text encoding is detected with chardet, unless a known encoding is given, eg. from the
+        Encoding entry of the module config.
+        Files are opened when first needed and kept open by file_pool, by default the pool shared by
+        all bibles (see files.FilePool). Use close() or a with-statement to release them.
+        If preload is true, the whole text is read into memory when opening, see preload().
+        With readahead, the blocks of ztext modules needed for a request are read and decompressed in
+        background threads, up to readahead blocks ahead of the one being consumed. By default readahead
+        is twice decompress_workers, the number of blocks to decompress at once; 0 turns it off. The
+        threads are those of executor, by default the pool shared by all bibles (see
+        decompress_executor()), so opening many bibles does not start threads for each.
+        If text_cache, an LRUCache, is given, the decoded and filtered text of the verses read by getiter,
+        getiter_verses and get is kept in it, its max_bytes limits the memory used by the text (see
+        cache.CachedText). cache.text_cache is a cache that can be shared by several bibles, so that they
+        use a common memory budget.
+        '''
+        self.__structure = get_structure(versification)
         self.__module_type = module_type
         self.__module_path = module_path
+        if use_mmap:
+            self.__reader_class = MmapReader
+        else:
+            self.__reader_class = functools.partial(FileReader, pool=file_pool)
+        self.__zip_file = zip_file
+        # Decompressed ztext blocks, keyed by (testament, buf_num)
+        self.__block_cache = LRUCache(block_cache_size, block_cache_bytes)
+        # Decoded verse text, keyed by (bible id, testament, index, filter mode, filter state)
+        self.__text_cache = text_cache
+        self.__text_cache_id = next(_bible_ids)
+        if readahead is None:
+            readahead = 2 * decompress_workers
+        self.__readahead = readahead
+        self.__executor = None
+        if readahead:
+            self.__executor = decompress_executor() if executor is None else executor
         #self.__modules_path = os.path.join(os.environ['HOME'], '.sword', 'modules', 'texts', self.__module_type)
         self.__files = {
             'ot': None,
             'nt': None
             }
+        # Verse and block records of each testament, loaded into columnar arrays on first use
+        self.__verse_tables = {}
+        self.__block_tables = {}
+        # Preloaded text of each testament: (text of all verses, array of verse offsets)
+        self.__preloaded = {}
+        # Loaded search indexes by path
+        self.__search_indexes = {}
         if self.__module_type in (SwordModuleType.ZTEXT, SwordModuleType.ZTEXT4):
             try:
                 self.__files['ot'] = self.__get_ztext_files('ot')
@@ -66,97 +150,488 @@ class SwordBible(object):
             raise ValueError('Invalid module type: %s' % module_type)
         if self.__files['ot'] is None and self.__files['nt'] is None:
             raise OSError('Could not open OT or NT for module')
-        # Set verse record format and size
+        # Set verse record format
         if self.__module_type == SwordModuleType.ZTEXT:
             self.__verse_record_format = '<IIH'
-            self.__verse_record_size = 10
         elif self.__module_type == SwordModuleType.ZTEXT4:
             self.__verse_record_format = '<III'
-            self.__verse_record_size = 12
         elif self.__module_type == SwordModuleType.RAWTEXT:
             self.__verse_record_format = '<IH'
-            self.__verse_record_size = 6
         elif self.__module_type == SwordModuleType.RAWTEXT4:
             self.__verse_record_format = '<II'
-            self.__verse_record_size = 8
-        # Detect text-encoding
+        # Use the given text-encoding if it is known, otherwise detect it
+        try:
+            self.__encoding = codecs.lookup(encoding).name
+        except (TypeError, LookupError):
+            self.__encoding = self.__detect_encoding()
+        if preload:
+            self.preload()
+
+    def __detect_encoding(self):
+        import chardet
+        if self.__files['ot']:
+            testament = 'ot'
+        else:
+            testament = 'nt'
         if self.__module_type in (SwordModuleType.ZTEXT, SwordModuleType.ZTEXT4):
-            if self.__files['ot']:
-                testament = 'ot'
-            else:
-                testament = 'nt'
-            ret = self.__uncompressed_text(testament, 0)
-            self.__encoding = chardet.detect(ret)['encoding']
+            sample = self.__uncompressed_text(testament, 0)
         else:
-            if self.__files['ot']:
-                testament = 'ot'
-            else:
-                testament = 'nt'
-            self.__encoding = chardet.detect(self.__files[testament][1].read(1024))['encoding']
+            sample = bytes(self.__files[testament][1].read(0, 1024))
+        return chardet.detect(sample)['encoding']
+
+    def __open_file(self, name):
+        '''Returns a reader for the module file with the given name.'''
+        if self.__zip_file is not None:
+            return open_zip_member(self.__zip_file, posixpath.normpath(posixpath.join(self.__module_path, name)),
+                                   self.__reader_class)
+        return self.__reader_class(os.path.join(self.__module_path, name))
 
     def __get_ztext_files(self, testament):
         '''Given a testament ('ot' or 'nt'), returns a tuple of files
         (verse_to_buf, buf_to_loc, text)
         '''
-        v2b_name, b2l_name, text_name = [os.path.join(self.__module_path,
-                                                      '%s.bz%s' % (testament, code))
-                                         for code in ('v', 's', 'z')]
-        return [open(name, 'rb') for name in (v2b_name, b2l_name, text_name)]
+        return [self.__open_file('%s.bz%s' % (testament, code)) for code in ('v', 's', 'z')]
 
     def __get_rawtext_files(self, testament):
         '''Given a testament ('ot' or 'nt'), returns a tuple of files
         (verse_to_loc, text)
         '''
-        v2l_name = os.path.join(self.__module_path, '%s.vss' % testament)
-        text_name = os.path.join(self.__module_path, '%s' % testament)
-        return [open(name, 'rb') for name in (v2l_name, text_name)]
+        return [self.__open_file(name) for name in ('%s.vss' % testament, testament)]
+
+    def __record_table(self, reader, record_format):
+        '''Read all records of an index file in one go and return them as a list of arrays,
+        one array per field of record_format.
+        '''
+        record_size = struct.calcsize(record_format)
+        data = reader.read_all()
+        # Ignore a trailing partial record
+        data = data[:len(data) - len(data) % record_size]
+        columns = zip(*struct.iter_unpack(record_format, data))
+        tables = [array(code) for code in record_format[1:]]
+        for table, column in zip(tables, columns):
+            table.extend(column)
+        return tables
+
+    def __verse_table(self, testament):
+        '''Returns the verse records of a testament as columns: (buf_num, verse_start, verse_len)
+        for ztext and (verse_start, verse_len) for rawtext.
+        '''
+        table = self.__verse_tables.get(testament)
+        if table is None:
+            table = self.__record_table(self.__files[testament][0], self.__verse_record_format)
+            self.__verse_tables[testament] = table
+        return table
+
+    def __block_table(self, testament):
+        '''Returns the compressed block records of a testament as columns: (offset, size, uc_size)'''
+        table = self.__block_tables.get(testament)
+        if table is None:
+            table = self.__record_table(self.__files[testament][1], '<III')
+            self.__block_tables[testament] = table
+        return table
 
-    def __ztext_for_index(self, testament, index):
-        '''Get the ztext for a given index.'''
-        verse_to_buf, buf_to_loc, text = self.__files[testament]
+    def __runs(self, indicies):
+        '''Split a list of indicies into runs of increasing, nearly consecutive indicies. The chapter and
+        book headings between verses do not break a run, so a whole book is a single run.
+        '''
+        run = []
+        for index in indicies:
+            if run and not 0 < index - run[-1] <= 3:
+                yield run
+                run = []
+            run.append(index)
+        if run:
+            yield run
+
+    def __blocks(self, testament, block_nums):
+        '''Get the uncompressed blocks with the given numbers, in order. With readahead (or
+        decompress_workers), the blocks are decompressed in background threads, up to readahead blocks
+        ahead of the one being returned.
+        '''
+        executor = self.__executor
+        if executor is None or len(block_nums) < 2:
+            for buf_num in block_nums:
+                yield self.__uncompressed_text(testament, buf_num)
+            return
+        pending = collections.deque()
+        for buf_num in block_nums:
+            pending.append(executor.submit(self.__uncompressed_text, testament, buf_num))
+            if len(pending) > self.__readahead:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
-        # Read the verse record, verse_len differs in ztext and ztext4.
-        verse_to_buf.seek(self.__verse_record_size*index)
-        buf_num, verse_start, verse_len = struct.unpack(self.__verse_record_format,
-                                                        verse_to_buf.read(self.__verse_record_size))
-        uncompressed_text = self.__uncompressed_text(testament, buf_num)
-        return uncompressed_text[verse_start:verse_start+verse_len].decode(self.__encoding, errors='replace')
+    def __ztext_for_run(self, testament, run):
+        '''Get the ztext for a run of indicies. Each block is fetched once for all the
+        verses of the run located in it.
+        '''
+        buf_nums, verse_starts, verse_lens = self.__verse_table(testament)
+        # The blocks in the order they are needed
+        block_nums = []
+        for index in run:
+            if not block_nums or buf_nums[index] != block_nums[-1]:
+                block_nums.append(buf_nums[index])
+        blocks = self.__blocks(testament, block_nums)
+        current_buf_num = None
+        uncompressed_text = None
+        for index in run:
+            # Look up the verse record, verse_len differs in ztext and ztext4.
+            buf_num = buf_nums[index]
+            if buf_num != current_buf_num:
+                uncompressed_text = memoryview(next(blocks))
+                current_buf_num = buf_num
+            verse_start = verse_starts[index]
+            yield uncompressed_text[verse_start:verse_start+verse_lens[index]]
 
     def __uncompressed_text(self, testament, buf_num):
-        verse_to_buf, buf_to_loc, text = self.__files[testament]
+        uncompressed_text = self.__block_cache.get((testament, buf_num))
+        if uncompressed_text is None:
+            uncompressed_text = self.__decompress_block(testament, buf_num)
+            self.__block_cache.put((testament, buf_num), uncompressed_text)
+        return uncompressed_text
 
-        # Determine where the compressed data starts and ends.
-        buf_to_loc.seek(buf_num*12)
-        offset, size, uc_size = struct.unpack('<III', buf_to_loc.read(12))
+    def __decompress_block(self, testament, buf_num):
+        offsets, sizes, uc_sizes = self.__block_table(testament)
 
         # Get the compressed data.
-        text.seek(offset)
-        compressed_data = text.read(size)
+        compressed_data = self.__files[testament][2].read(offsets[buf_num], sizes[buf_num])
         return zlib.decompress(compressed_data)
 
-    def __rawtext_for_index(self, testament, index):
-        '''Get the rawtext for a given index.'''
-        verse_to_loc, text = self.__files[testament]
+    def __rawtext_for_run(self, testament, run):
+        '''Get the rawtext for a run of indicies, using a single read of the text file.'''
+        verse_starts, verse_lens = self.__verse_table(testament)
+
+        # Find the part of the text file covering all verses in the run. Empty verses are skipped
+        # since their start is not necessarily inside that part.
+        span_start = None
+        span_end = 0
+        for index in run:
+            if verse_lens[index]:
+                verse_start = verse_starts[index]
+                if span_start is None or verse_start < span_start:
+                    span_start = verse_start
+                span_end = max(span_end, verse_start + verse_lens[index])
+        if span_start is None:
+            span = memoryview(b'')
+        else:
+            span = memoryview(self.__files[testament][1].read(span_start, span_end - span_start))
+
+        for index in run:
+            verse_len = verse_lens[index]
+            if verse_len:
+                verse_start = verse_starts[index] - span_start
+                yield span[verse_start:verse_start+verse_len]
+            else:
+                yield span[0:0]
+
+    def __verses_for_indicies(self, testament, indicies):
+        '''Get the undecoded text of the verses with the given indicies, in order.'''
+        if testament in self.__preloaded:
+            text, offsets = self.__preloaded[testament]
+            for index in indicies:
+                yield text[offsets[index]:offsets[index+1]]
+            return
+        if self.__module_type in (SwordModuleType.ZTEXT, SwordModuleType.ZTEXT4):
+            text_for_run = self.__ztext_for_run
+        else:
+            text_for_run = self.__rawtext_for_run
+        for run in self.__runs(indicies):
+            for verse in text_for_run(testament, run):
+                yield verse
+
+    def __texts_for_indicies(self, testament, indicies, markup_filter):
+        '''Get the decoded text of the verses with the given indicies, in order, passed through
+        markup_filter if it is not None. With a text cache, only the verses not in it are read.
+        '''
+        if self.__text_cache is None:
+            for verse, final in zip(self.__verses_for_indicies(testament, indicies), _ends_of_runs(indicies)):
+                yield self.__decode(verse, markup_filter, final)
+            return
+        # The filtered text of a verse depends on the state the filter is left in by the previous verse, so
+        # that is part of the key. Without a filter the key is just the verse.
+        if markup_filter is None:
+            mode = reset_state = None
+        else:
+            mode = markup_filter.mode
+            reset_state = MarkupFilter(mode).state
+        cache = self.__text_cache
+        ends = list(_ends_of_runs(indicies))
+        lookahead = None  # (key, cached text) found while looking for missing verses
+        pos = 0
+        while pos < len(indicies):
+            state = None if markup_filter is None else markup_filter.state
+            key = (self.__text_cache_id, testament, indicies[pos], mode, state)
+            if lookahead is not None and lookahead[0] == key:
+                cached = lookahead[1]
+            else:
+                cached = cache.get(key)
+            lookahead = None
+            if cached is not None:
+                text = cached.text
+                if markup_filter is not None:
+                    markup_filter.state = cached.state
+                    if ends[pos]:
+                        text += self.__decode(markup_filter.flush(), None, True)
+                yield text
+                pos += 1
+                continue
+            # Find the following verses missing too, assuming the common case of a filter that is reset after
+            # each verse, and read them all at once
+            end = pos + 1
+            while end < len(indicies):
+                next_key = (self.__text_cache_id, testament, indicies[end], mode, reset_state)
+                next_cached = cache.get(next_key)
+                if next_cached is not None:
+                    lookahead = (next_key, next_cached)
+                    break
+                end += 1
+            missing = indicies[pos:end]
+            verses = self.__verses_for_indicies(testament, missing)
+            for index, verse, final in zip(missing, verses, ends[pos:end]):
+                state = None if markup_filter is None else markup_filter.state
+                text = self.__decode(verse, markup_filter, False)
+                cache.put((self.__text_cache_id, testament, index, mode, state),
+                          CachedText(text, None if markup_filter is None else markup_filter.state))
+                if final and markup_filter is not None:
+                    text += self.__decode(markup_filter.flush(), None, True)
+                yield text
+            pos = end
+
+    def __verse_list_for_indicies(self, testament, indicies):
+        '''Get the undecoded text of the verses with the given indicies, as a list of bytes.'''
+        return [bytes(verse) for verse in self.__verses_for_indicies(testament, indicies)]
+
+    def __markup_filter(self, filter_mode):
+        '''Returns a filters.MarkupFilter for filter_mode, or None if no filter_mode is given.'''
+        if filter_mode is None:
+            return None
+        return MarkupFilter(filter_mode, self.__encoding)
 
-        # Read the verse record.
-        verse_to_loc.seek(self.__verse_record_size*index)
-        verse_start, verse_len = struct.unpack(self.__verse_record_format, verse_to_loc.read(self.__verse_record_size))
-        text.seek(verse_start)
-        return text.read(verse_len).decode(self.__encoding, errors='replace')
+    def __decode(self, verse, markup_filter, final):
+        '''Decode the undecoded text of a verse, passing it through markup_filter first if it is not None.
+        final tells if the verse is the last of a run of consecutive verses, see MarkupFilter.feed.
+        '''
+        if markup_filter is not None:
+            verse = markup_filter.feed(verse, final)
+        return str(verse, self.__encoding, errors='replace')
+
+    def __fingerprint(self, testament):
+        '''Describes the state of the module files of a testament, it changes when the files change.'''
+        if self.__zip_file is not None:
+            paths = [self.__zip_file.filename]
+        else:
+            paths = [reader.path for reader in self.__files[testament]]
+        fingerprint = []
+        for path in paths:
+            stat = os.stat(path)
+            fingerprint.append([os.path.basename(path), stat.st_size, stat.st_mtime_ns])
+        return fingerprint
 
     ###### USER FACING #################################################################################
-    def getiter(self, books=None, chapters=None, verses=None):
-        '''Retrieve the text for a given reference'''
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        '''Close the module files and drop cached data. The bible cannot be read afterwards.'''
+        for files in self.__files.values():
+            if files:
+                for reader in files:
+                    reader.close()
+        # The executor is shared, it is not shut down
+        self.__executor = None
+        self.__verse_tables.clear()
+        self.__block_tables.clear()
+        self.__block_cache.clear()
+        self.__preloaded.clear()
+        if self.__text_cache is not None:
+            # The cache may be shared with other bibles
+            self.__text_cache.purge(lambda key: key[0] == self.__text_cache_id)
+
+    @property
+    def block_cache(self):
+        '''The LRUCache holding decompressed blocks of ztext modules, see LRUCache.stats().'''
+        return self.__block_cache
+
+    @property
+    def structure(self):
+        '''The BibleStructure of the versification of the module.'''
+        return self.__structure
+
+    @property
+    def testaments(self):
+        '''The testaments ('ot' and/or 'nt') the module has text for.'''
+        return [testament for testament, files in self.__files.items() if files is not None]
+
+    @property
+    def text_cache(self):
+        '''The LRUCache holding decoded verse text given when opening, or None.'''
+        return self.__text_cache
+
+    def preload(self):
+        '''Read the whole text into memory, all verses are served from memory afterwards. The text of each
+        testament is kept undecoded in one buffer with an array of verse offsets. Returns the memory
+        footprint in bytes, see memory_footprint.
+        '''
+        for testament, files in self.__files.items():
+            if files is None or testament in self.__preloaded:
+                continue
+            num_verses = len(self.__verse_table(testament)[0])
+            text = bytearray()
+            offsets = array('I', [0])
+            for verse in self.__verses_for_indicies(testament, range(num_verses)):
+                text += verse
+                offsets.append(len(text))
+            self.__preloaded[testament] = (memoryview(bytes(text)), offsets)
+        # The blocks are not needed anymore
+        self.__block_cache.clear()
+        return self.memory_footprint
+
+    @property
+    def memory_footprint(self):
+        '''Bytes used by the preloaded text and the verse offsets, 0 if not preloaded.'''
+        return sum(len(text) + len(offsets) * offsets.itemsize for text, offsets in self.__preloaded.values())
+
+    def getiter(self, books=None, chapters=None, verses=None, filter_mode=None):
+        '''Retrieve the text for a given reference. If filter_mode is given, the markup is removed from the
+        text, see filters.MarkupFilterMode for the modes.
+        '''
+        indicies = self.__structure.ref_to_indicies(books=books, chapters=chapters, verses=verses)
+        markup_filter = self.__markup_filter(filter_mode)
+
+        for testament, idxs in indicies.items():
+            for text in self.__texts_for_indicies(testament, idxs, markup_filter):
+                yield text
+
+    def getiter_verses(self, books=None, chapters=None, verses=None, filter_mode=None):
+        '''Like getiter, but yields Verse tuples of (book name, chapter, verse, text).'''
+        refs = self.__structure.ref_to_indicies_and_references(books=books, chapters=chapters, verses=verses)
+        for verse in self.getiter_references(refs, filter_mode=filter_mode):
+            yield verse
+
+    def getiter_references(self, refs, filter_mode=None):
+        '''Like getiter_verses, for a reference already resolved with ref_to_indicies_and_references() of
+        the BibleStructure of the versification of the module, see structure.
+        '''
+        markup_filter = self.__markup_filter(filter_mode)
+
+        for testament, (idxs, references) in refs.items():
+            texts = self.__texts_for_indicies(testament, idxs, markup_filter)
+            for (book, chapter, verse), text in zip(references, texts):
+                yield Verse(book, chapter, verse, text)
+
+    def get(self, books=None, chapters=None, verses=None, join='\n', filter_mode=None):
+        output = []
+        output.extend(list(self.getiter(books=books, chapters=chapters, verses=verses, filter_mode=filter_mode)))
+        return join.join(output)
+
+    def __update_index(self, index_class, index_path):
+        '''Load the index in index_path, and (re)build the sections of the testaments whose module files
+        changed since it was built.
+        '''
+        index = self.__search_indexes.get(index_path)
+        if not isinstance(index, index_class):
+            index = index_class(index_path)
+        testaments = self.testaments
+        changed = False
+        for testament in index.testaments():
+            if testament not in testaments:
+                index.remove_section(testament)
+                changed = True
+        for testament in testaments:
+            fingerprint = self.__fingerprint(testament)
+            if not index.is_current(testament, fingerprint):
+                idxs = self.__structure.ref_to_indicies().get(testament, [])
+                texts = (str(verse, self.__encoding, errors='replace')
+                         for verse in self.__verses_for_indicies(testament, idxs))
+                index.build_section(testament, fingerprint, zip(idxs, texts))
+                changed = True
+        if changed:
+            index.save()
+        self.__search_indexes[index_path] = index
+        return index
+
+    def __loaded_index(self, index_class, index_path):
+        '''Returns the index in index_path, it is loaded and brought up to date when first used.'''
+        index = self.__search_indexes.get(index_path)
+        if not isinstance(index, index_class):
+            index = self.__update_index(index_class, index_path)
+        return index
+
+    def __references(self, results):
+        '''Map (testament, index) results of an index to (book name, chapter, verse).'''
+        references = []
+        for testament, idx in results:
+            reference = self.__structure.index_to_reference(testament, idx)
+            if reference is not None:
+                references.append(reference)
+        return references
+
+    def build_search_index(self, index_path):
+        '''Build the full-text index of the module in index_path, or update it if it exists. Only the
+        testaments whose module files changed since the index was built are indexed again. Each module
+        needs its own index_path. Returns the search.SearchIndex.
+        '''
+        return self.__update_index(SearchIndex, index_path)
+
+    def search(self, query, index_path):
+        '''Search the module for query and return a list of (book name, chapter, verse) of the matching
+        verses, in bible order. A query consists of words, "quoted phrases", AND (the default), OR, NOT
+        (or a leading -) and parentheses, eg. 'light -"let there be"'. The index in index_path is built
+        or updated if needed when the bible first uses it; use build_search_index to pick up later changes
+        of the module files.
+        '''
+        return self.__references(self.__loaded_index(SearchIndex, index_path).search(query))
+
+    def build_lemma_index(self, index_path):
+        '''Build the index of Strong's numbers, lemmas and morphology codes in the markup of the module in
+        index_path, or update it like build_search_index. Returns the search.LemmaIndex.
+        '''
+        return self.__update_index(LemmaIndex, index_path)
+
+    def find_lemma(self, lemma, index_path):
+        '''Returns a list of (book name, chapter, verse) of the verses tagged with lemma, eg. a Strong's
+        number like 'H430' or 'strong:H0430', or a morphology code like 'robinson:N-NSM'. The index in
+        index_path is built or updated if needed when the bible first uses it, like in search.
+        '''
+        return self.__references(self.__loaded_index(LemmaIndex, index_path).search(lemma))
+
+    async def agetiter(self, books=None, chapters=None, verses=None, executor=None, chunk_size=256,
+                       filter_mode=None):
+        '''Asynchronous version of getiter. The verses are read and decompressed in executor (the default
+        executor of the event loop if None) in chunks of chunk_size verses. The next chunk is read while
+        the verses of the current one are consumed, at most two chunks are in flight per iterator.
+        '''
+        # asyncio is slow to import, and only needed here
+        import asyncio
+        loop = asyncio.get_running_loop()
         indicies = self.__structure.ref_to_indicies(books=books, chapters=chapters, verses=verses)
+        # Decoding and filtering is done here, since the filter state runs from one chunk to the next
+        markup_filter = self.__markup_filter(filter_mode)
 
+        pending = collections.deque()  # (future, whether each verse ends a run)
         for testament, idxs in indicies.items():
-            for idx in idxs:
-                if self.__module_type in (SwordModuleType.ZTEXT, SwordModuleType.ZTEXT4):
-                    yield self.__ztext_for_index(testament, idx)
-                else:
-                    yield self.__rawtext_for_index(testament, idx)
+            ends = list(_ends_of_runs(idxs))
+            for start in range(0, len(idxs), chunk_size):
+                pending.append((loop.run_in_executor(executor, self.__verse_list_for_indicies, testament,
+                                                     idxs[start:start+chunk_size]),
+                                ends[start:start+chunk_size]))
+                if len(pending) > 1:
+                    future, chunk_ends = pending.popleft()
+                    for verse, final in zip(await future, chunk_ends):
+                        yield self.__decode(verse, markup_filter, final)
+        while pending:
+            future, chunk_ends = pending.popleft()
+            for verse, final in zip(await future, chunk_ends):
+                yield self.__decode(verse, markup_filter, final)
 
-    def get(self, books=None, chapters=None, verses=None, join='\n'):
+    async def aget(self, books=None, chapters=None, verses=None, join='\n', executor=None, chunk_size=256,
+                   filter_mode=None):
+        '''Asynchronous version of get, see agetiter.'''
         output = []
-        output.extend(list(self.getiter(books=books, chapters=chapters, verses=verses)))
+        async for verse in self.agetiter(books=books, chapters=chapters, verses=verses, executor=executor,
+                                         chunk_size=chunk_size, filter_mode=filter_mode):
+            output.append(verse)
         return join.join(output)
@@ -18,29 +18,51 @@
 # Temple Place, Suite 330, Boston, MA 02111-1307 USA                          #
 ###############################################################################
 
-from .canons import *
+import bisect
+import threading
+
+from .canons import get_canon
 
 
 class BookStructure(object):
+    __slots__ = ('name', 'osis_name', 'preferred_abbreviation', 'chapter_lengths', 'num_chapters',
+                 '__names', '__chapter_offsets', '__size')
+
     def __init__(self, name, osis_name, preferred_abbreviation, chapter_lengths):
         self.name = name
         self.osis_name = osis_name
         self.preferred_abbreviation = preferred_abbreviation
-        self.chapter_lengths = chapter_lengths
+        self.chapter_lengths = tuple(chapter_lengths)
         self.num_chapters = len(chapter_lengths)
+        self.__names = frozenset(n.casefold() for n in (name, osis_name, preferred_abbreviation))
+        # Offset of the first verse of each chapter (and one past the last chapter): chapter lengths to this
+        # point; plus 1 for every chapter title; plus 1 for book title
+        chapter_offsets = []
+        offset = 2
+        for chapter_length in chapter_lengths:
+            chapter_offsets.append(offset)
+            offset += chapter_length + 1
+        chapter_offsets.append(offset)
+        self.__chapter_offsets = tuple(chapter_offsets)
+        # Total verses + chapter heading for each chapter + 1 for book title
+        self.__size = offset - 1
 
     def __repr__(self):
         return 'Book(%s)' % self.name
 
+    @property
+    def names(self):
+        '''The case-folded names the book can be looked up by.'''
+        return self.__names
+
     def name_matches(self, name):
-        name = name.lower()
-        return name in [self.name.lower(), self.osis_name.lower(), self.preferred_abbreviation.lower()]
+        return name.casefold() in self.__names
 
     def chapter_offset(self, chapter_index):
-        # Add chapter lengths to this point; plus 1 for every chapter title; plus 1 for book title
-        return sum(self.chapter_lengths[:chapter_index]) + (chapter_index + 1) + 1
+        return self.__chapter_offsets[chapter_index]
 
-    def get_indicies(self, chapters=None, verses=None, offset=0):
+    def __chapters_and_verses(self, chapters, verses):
+        '''Returns a list of (chapter, verses of the chapter) for a reference.'''
         if chapters is None:
             chapters = list(range(1, self.num_chapters+1))
         elif isinstance(chapters, int):
@@ -49,106 +71,153 @@ class BookStructure(object):
             verses = None
         elif isinstance(verses, int):
             verses = [verses]
+        if verses is None:
+            return [(chapter, range(1, self.chapter_lengths[chapter-1] + 1)) for chapter in chapters]
+        return [(chapter, verses) for chapter in chapters]
 
+    def get_indicies(self, chapters=None, verses=None, offset=0):
         refs = []
-        for chapter in chapters:
-            if verses is None:
-                tmp_verses = list(range(1, self.chapter_lengths[chapter-1]+1))
-            else:
-                tmp_verses = verses
-            refs.extend([offset + self.chapter_offset(chapter-1) + verse-1 for verse in tmp_verses])
+        for chapter, chapter_verses in self.__chapters_and_verses(chapters, verses):
+            chapter_start = offset + self.__chapter_offsets[chapter-1] - 1
+            refs.extend([chapter_start + verse for verse in chapter_verses])
         return refs
 
+    def index_to_reference(self, index):
+        '''Returns (chapter, verse) of the verse with the given index within the book, or None if the
+        index is not a verse.
+        '''
+        chapter = bisect.bisect_right(self.__chapter_offsets, index, 0, self.num_chapters)
+        if chapter == 0:
+            return None
+        verse = index - self.__chapter_offsets[chapter-1] + 1
+        if verse > self.chapter_lengths[chapter-1]:
+            return None
+        return chapter, verse
+
+    def get_indicies_and_references(self, chapters=None, verses=None, offset=0):
+        '''Like get_indicies, but also returns a list of (chapter, verse) for each index.'''
+        indicies = []
+        references = []
+        for chapter, chapter_verses in self.__chapters_and_verses(chapters, verses):
+            chapter_start = offset + self.__chapter_offsets[chapter-1] - 1
+            indicies.extend([chapter_start + verse for verse in chapter_verses])
+            references.extend([(chapter, verse) for verse in chapter_verses])
+        return indicies, references
+
     @property
     def size(self):
-        # Total verses + chapter heading for each chapter + 1 for book title
-        return sum(self.chapter_lengths) + len(self.chapter_lengths) + 1
+        return self.__size
 
 
 class BibleStructure(object):
 
     def __init__(self, versification):
         self.__section_order = ['ot', 'nt']
-        self.__book_offsets = None  # offsets within sections
+        self.__book_offsets = {}  # offsets within sections
+        self.__book_names = {}  # case-folded names and aliases -> (testament, book)
 
         self.__books = {
             'ot': [],
             'nt': [],
         }
         # Find the canon used. The canons are original defined in SWORD header files.
-        canon = default
-        if versification == 'catholic2':
-            canon = catholic2
-        elif versification == 'german':
-            canon = german
-        elif versification == 'kjva':
-            canon = kjva
-        elif versification == 'leningrad':
-            canon = leningrad
-        elif versification == 'luther':
-            canon = luther
-        elif versification == 'lxx':
-            canon = lxx
-        elif versification == 'mt':
-            canon = mt
-        elif versification == 'nrsva':
-            canon = nrsva
-        elif versification == 'nrsv':
-            canon = nrsv
-        elif versification == 'orthodox':
-            canon = orthodox
-        elif versification == 'synodal':
-            canon = synodal
-        elif versification == 'synodalprot':
-            canon = synodalprot
-        elif versification == 'vulg':
-            canon = vulg
+        canon = get_canon(versification)
         # Based on the canon create the BookStructure objects needed
         for book in canon['ot']:
             self.__books['ot'].append(BookStructure(*book))
         for book in canon['nt']:
             self.__books['nt'].append(BookStructure(*book))
-
-    def __update_book_offsets(self):
-        # Compute index offsets and add other data
-        # FIXME: this is still a little hairy.
-        self.__book_offsets = {}
+        # Compute index offsets of the books; together with the chapter offsets of each book this gives
+        # the index of any verse without walking the structure.
+        self.__testament_book_offsets = {}  # sorted offsets of the books in each testament
         for testament, books in self.__books.items():
             idx = 2  # start after the testament heading
+            self.__testament_book_offsets[testament] = []
             for book in books:
                 self.__book_offsets[book.name] = idx
-                offset = 1  # start after the book heading
+                self.__testament_book_offsets[testament].append(idx)
                 idx += book.size
-
-    def __book_offset(self, book_name):
-        if self.__book_offsets is None:
-            self.__update_book_offsets()
-        return self.__book_offsets[book_name]
+                # The first book with a given name wins, like when searching the books in order
+                for name in book.names:
+                    self.__book_names.setdefault(name, (testament, book))
 
     def find_book(self, name):
-        name = name.lower()
-        for testament, books in self.__books.items():
-            for num, book in enumerate(books):
-                if book.name_matches(name):
-                    return testament, book
-        raise ValueError("Book name \'%s\' does not exist in BibleStructure." % name)
-
-    def ref_to_indicies(self, books=None, chapters=None, verses=None):
+        try:
+            return self.__book_names[name.casefold()]
+        except KeyError:
+            raise ValueError("Book name \'%s\' does not exist in BibleStructure." % name.lower())
+
+    def add_alias(self, alias, name):
+        '''Make the book known as name also available as alias, eg. add_alias('Jn', 'John').
+        Note that structures returned by get_structure() are shared, so the alias applies to every
+        bible using the versification.
+        '''
+        self.__book_names[alias.casefold()] = self.find_book(name)
+
+    def ref_to_index(self, book, chapter, verse):
+        '''Returns (testament, index) of a single verse.'''
+        testament, book = self.find_book(book)
+        return testament, self.__book_offsets[book.name] + book.chapter_offset(chapter-1) + verse-1
+
+    def index_to_reference(self, testament, index):
+        '''Returns (book name, chapter, verse) of the verse with the given index, or None if the index
+        is not a verse (eg. a heading).
+        '''
+        book_num = bisect.bisect_right(self.__testament_book_offsets[testament], index) - 1
+        if book_num < 0:
+            return None
+        book = self.__books[testament][book_num]
+        reference = book.index_to_reference(index - self.__book_offsets[book.name])
+        if reference is None:
+            return None
+        return (book.name,) + reference
+
+    def __find_books(self, books):
         # TODO: CHECK NOT OVERSPECIFIED
         if books is None:
             # Return all books
-            books = []
-            for section in self.__books:
-                books.extend([b.name for b in self.__books[section]])
-        elif isinstance(books, str):
+            return [(testament, book) for testament in self.__books for book in self.__books[testament]]
+        if isinstance(books, str):
             books = [books]
+        return [self.find_book(book) for book in books]
 
+    def ref_to_indicies(self, books=None, chapters=None, verses=None):
         refs = {}
-        for book in books:
-            testament, book = self.find_book(book)
+        for testament, book in self.__find_books(books):
             if testament not in refs:
                 refs[testament] = []
             refs[testament].extend(book.get_indicies(chapters=chapters, verses=verses,
-                                                     offset=self.__book_offset(book.name)))
-            # Deal with the one book presented.
+                                                     offset=self.__book_offsets[book.name]))
         return refs
+
+    def ref_to_indicies_and_references(self, books=None, chapters=None, verses=None):
+        '''Like ref_to_indicies, but the value for each testament is a tuple of the list of indicies and
+        a list of (book name, chapter, verse) for each index.
+        '''
+        refs = {}
+        for testament, book in self.__find_books(books):
+            if testament not in refs:
+                refs[testament] = ([], [])
+            indicies, references = book.get_indicies_and_references(chapters=chapters, verses=verses,
+                                                                    offset=self.__book_offsets[book.name])
+            refs[testament][0].extend(indicies)
+            refs[testament][1].extend([(book.name, chapter, verse) for chapter, verse in references])
+        return refs
+
+
+_structures = {}
+_structures_lock = threading.Lock()
+
+
+def get_structure(versification):
+    '''Returns the BibleStructure of a versification. The structure is only built the first time
+    and is shared by every caller in the process afterwards.
+    '''
+    try:
+        return _structures[versification]
+    except KeyError:
+        pass
+    with _structures_lock:
+        if versification not in _structures:
+            _structures[versification] = BibleStructure(versification)
+        return _structures[versification]
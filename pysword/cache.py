@@ -0,0 +1,121 @@
+###############################################################################
+# PySword - A native Python reader of the SWORD Project Bible Modules         #
+# --------------------------------------------------------------------------- #
+# Copyright (c) 2008-2015 Various developers:                                 #
+# Kenneth Arnold, Joshua Gross, Ryan Hiebert, Matthew Wardrop, Tomas Groth    #
+# --------------------------------------------------------------------------- #
+# This program is free software; you can redistribute it and/or modify it     #
+# under the terms of the GNU General Public License as published by the Free  #
+# Software Foundation; version 2 of the License.                              #
+#                                                                             #
+# This program is distributed in the hope that it will be useful, but WITHOUT #
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or       #
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for    #
+# more details.                                                               #
+#                                                                             #
+# You should have received a copy of the GNU General Public License along     #
+# with this program; if not, write to the Free Software Foundation, Inc., 59  #
+# Temple Place, Suite 330, Boston, MA 02111-1307 USA                          #
+###############################################################################
+
+import sys
+import threading
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    '''A least-recently-used cache bounded by number of entries and by total size in bytes.
+
+    Values are expected to support len(), which is used as their size. A limit of None
+    means unbounded, a limit of 0 disables the cache. The cache can be used from several threads.
+    '''
+
+    def __init__(self, max_entries=None, max_bytes=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.__entries = OrderedDict()
+        self.__size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, key):
+        return key in self.__entries
+
+    @property
+    def size(self):
+        '''Total size in bytes of the cached values.'''
+        return self.__size
+
+    def get(self, key, default=None):
+        with self.__lock:
+            try:
+                value = self.__entries.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self.__entries[key] = value
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        value_size = len(value)
+        if self.max_entries == 0 or (self.max_bytes is not None and value_size > self.max_bytes):
+            return
+        with self.__lock:
+            if key in self.__entries:
+                self.__size -= len(self.__entries.pop(key))
+            self.__entries[key] = value
+            self.__size += value_size
+            while (self.max_entries is not None and len(self.__entries) > self.max_entries) or \
+                    (self.max_bytes is not None and self.__size > self.max_bytes):
+                old_key, old_value = self.__entries.popitem(last=False)
+                self.__size -= len(old_value)
+                self.evictions += 1
+
+    def purge(self, predicate):
+        '''Remove the entries whose key predicate(key) is true for, returns the number removed.'''
+        with self.__lock:
+            keys = [key for key in self.__entries if predicate(key)]
+            for key in keys:
+                self.__size -= len(self.__entries.pop(key))
+            return len(keys)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = 0
+
+    def stats(self):
+        '''Return a dict with the current counters of the cache.'''
+        return {
+            'entries': len(self.__entries),
+            'bytes': self.__size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+class CachedText(object):
+    '''The decoded and filtered text of a verse kept in a text cache (see SwordBible), with the state of
+    the markup filter after the verse. Its len() is the memory used by the text, so the max_bytes limit of
+    any LRUCache holding it applies to memory.
+    '''
+    __slots__ = ('text', 'state', '__size')
+
+    def __init__(self, text, state):
+        self.text = text
+        self.state = state
+        self.__size = sys.getsizeof(text)
+
+    def __len__(self):
+        return self.__size
+
+
+# Cache of verse text that can be shared by several bibles, see SwordBible
+text_cache = LRUCache(max_bytes=16*1024*1024)
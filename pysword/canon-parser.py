@@ -25,10 +25,19 @@
 # canons ntbooks structs. This is not detected by this script. Because of this we also assume that canons
 # that does not include a book list of a testament also uses the versenumbers of the replacement it points to.
 #
+# Each canon is placed in its own module in the canons package, add it to canons.versifications too.
 # Batch convertion example:
-# for f in canon*.h; do python3 canon-parser.py $f >> canons.py; done
+# for f in canon_*.h; do python3 canon-parser.py $f > canons/$(basename $f .h).py; done
+#
+# With --binary the canon is also written in the binary canon file format, which can be loaded at runtime
+# with pysword.canons.load_canon_file() without adding a module:
+# python3 canon-parser.py --binary canon_kjva.canon canon_kjva.h
 
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from pysword.canons import pack_canon
 
 
 def parse_canon_header(filename):
@@ -70,21 +79,39 @@ def parse_canon_header(filename):
     nt = eval('[' + nt_struct.replace('{', '[').replace('}', ']') + ']')
     # Convert/evaluate the verse struct into python
     verses_per_chapter = eval('[' + verse_struct.replace('//', '#') + ']')
-    # Print the structure in the format pysword uses
-    name = os.path.splitext(os.path.basename(filename))[0][6:]
+    # Build the structure in the format pysword uses
+    versification = os.path.splitext(os.path.basename(filename))[0][6:]
+    canon = {}
     idx = 0
-    print(name + ' = {')
     for testament, contents in (('ot', ot), ('nt', nt)):
-        print('%r: [' % testament)
+        canon[testament] = []
         for num, (name, osis, pref_abbr, num_chapters) in enumerate(contents):
             new_idx = idx + num_chapters
             if name:
-                print('(%r, %r, %r, %r),' % (name, osis, pref_abbr, verses_per_chapter[idx:new_idx]))
+                canon[testament].append((name, osis, pref_abbr, verses_per_chapter[idx:new_idx]))
             idx = new_idx
+    return versification, canon
+
+
+def print_canon(versification, canon):
+    print(versification + ' = {')
+    for testament in ('ot', 'nt'):
+        print('%r: [' % testament)
+        for book in canon[testament]:
+            print('(%r, %r, %r, %r),' % book)
         print('],')
     print('}')
 
+
 if __name__ == '__main__':
-    import sys
-    canon_file_name = sys.argv[1]
-    parse_canon_header(canon_file_name)
+    args = sys.argv[1:]
+    binary_file_name = None
+    if args[0] == '--binary':
+        binary_file_name = args[1]
+        args = args[2:]
+    canon_file_name = args[0]
+    versification, canon = parse_canon_header(canon_file_name)
+    print_canon(versification, canon)
+    if binary_file_name:
+        with open(binary_file_name, 'wb') as binary_file:
+            binary_file.write(pack_canon(versification, canon))
@@ -0,0 +1,173 @@
+###############################################################################
+# PySword - A native Python reader of the SWORD Project Bible Modules         #
+# --------------------------------------------------------------------------- #
+# Copyright (c) 2008-2015 Various developers:                                 #
+# Kenneth Arnold, Joshua Gross, Ryan Hiebert, Matthew Wardrop, Tomas Groth    #
+# --------------------------------------------------------------------------- #
+# This program is free software; you can redistribute it and/or modify it     #
+# under the terms of the GNU General Public License as published by the Free  #
+# Software Foundation; version 2 of the License.                              #
+#                                                                             #
+# This program is distributed in the hope that it will be useful, but WITHOUT #
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or       #
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for    #
+# more details.                                                               #
+#                                                                             #
+# You should have received a copy of the GNU General Public License along     #
+# with this program; if not, write to the Free Software Foundation, Inc., 59  #
+# Temple Place, Suite 330, Boston, MA 02111-1307 USA                          #
+###############################################################################
+
+# List of canons supported by SWORD.
+# Mostly autogenerated by canon-parser.py. Manually added references to other canons testaments
+# where needed and suggested in the original headers.
+#
+# Each canon lives in its own submodule (canon_<versification>), which is only imported the first time the canon is used.
+# Canons can be accessed as attributes of this package (eg. canons.kjva) or with get_canon().
+#
+# Canons can also be stored in a compact binary format, which canon-parser.py can generate, and be
+# registered at runtime with load_canon_file(). All integers are little-endian:
+#   - header ('<4sHB'): magic b'PSWC', format version (1), length of the versification name
+#   - the versification name, utf-8
+#   - number of books ('<HH') in the ot and nt
+#   - for each book: name, osis name and preferred abbreviation, each as a length byte ('B') followed
+#     by utf-8, and the number of chapters ('<H')
+#   - the number of verses ('<H') of every chapter of every book, in order
+
+import importlib
+import struct
+import sys
+from array import array
+
+versifications = ('default', 'catholic', 'catholic2', 'german', 'kjva', 'leningrad', 'luther', 'lxx', 'mt',
+                  'nrsva', 'nrsv', 'orthodox', 'synodal', 'synodalprot', 'vulg')
+
+__all__ = list(versifications)
+
+CANON_FILE_MAGIC = b'PSWC'
+CANON_FILE_VERSION = 1
+
+# Canons registered at runtime, eg. from canon files
+_registered_canons = {}
+
+
+def get_canon(versification):
+    '''Returns the canon of the given versification, or the default canon if it is unknown. Note that
+    'catholic' is a known versification: before the canons were loaded by name, modules with
+    Versification=Catholic were read with the default canon.
+    '''
+    if versification in _registered_canons:
+        return _registered_canons[versification]
+    if versification not in versifications:
+        versification = 'default'
+    module = importlib.import_module('.canon_' + versification, __name__)
+    return getattr(module, versification)
+
+
+def register_canon(versification, canon):
+    '''Make canon available as the given versification. Register canons before opening any bibles
+    using the versification, since bible structures are built only once per versification.
+    '''
+    _registered_canons[versification] = canon
+
+
+def pack_canon(versification, canon):
+    '''Returns the canon in the binary canon file format.'''
+    name = versification.encode('utf-8')
+    data = [struct.pack('<4sHB', CANON_FILE_MAGIC, CANON_FILE_VERSION, len(name)), name,
+            struct.pack('<HH', len(canon['ot']), len(canon['nt']))]
+    verses = array('H')
+    for testament in ('ot', 'nt'):
+        for book in canon[testament]:
+            for text in book[:3]:
+                text = text.encode('utf-8')
+                data.append(struct.pack('<B', len(text)) + text)
+            data.append(struct.pack('<H', len(book[3])))
+            verses.extend(book[3])
+    if sys.byteorder == 'big':
+        verses.byteswap()
+    data.append(verses.tobytes())
+    return b''.join(data)
+
+
+def unpack_canon(data):
+    '''Parses the binary canon file format, returns (versification, canon). Raises ValueError if data is
+    not a valid canon file.
+    '''
+    try:
+        return _unpack_canon(data)
+    except (struct.error, IndexError, UnicodeDecodeError):
+        raise ValueError('Canon file is truncated or corrupt')
+
+
+def _unpack_canon(data):
+    magic, version, name_len = struct.unpack_from('<4sHB', data, 0)
+    if magic != CANON_FILE_MAGIC or version != CANON_FILE_VERSION:
+        raise ValueError('Not a canon file of version %d' % CANON_FILE_VERSION)
+    pos = struct.calcsize('<4sHB')
+    versification = bytes(data[pos:pos+name_len]).decode('utf-8')
+    pos += name_len
+    book_counts = struct.unpack_from('<HH', data, pos)
+    pos += 4
+    books = []
+    for book_count in book_counts:
+        testament_books = []
+        for i in range(book_count):
+            texts = []
+            for j in range(3):
+                text_len = data[pos]
+                texts.append(bytes(data[pos+1:pos+1+text_len]).decode('utf-8'))
+                pos += 1 + text_len
+            num_chapters, = struct.unpack_from('<H', data, pos)
+            pos += 2
+            testament_books.append((texts, num_chapters))
+        books.append(testament_books)
+    verses = array('H')
+    verses.frombytes(data[pos:])
+    if sys.byteorder == 'big':
+        verses.byteswap()
+    canon = {}
+    chapter = 0
+    for testament, testament_books in zip(('ot', 'nt'), books):
+        canon[testament] = []
+        for (name, osis_name, preferred_abbreviation), num_chapters in testament_books:
+            if chapter + num_chapters > len(verses):
+                raise ValueError('Canon file is truncated')
+            canon[testament].append((name, osis_name, preferred_abbreviation,
+                                     verses[chapter:chapter+num_chapters].tolist()))
+            chapter += num_chapters
+    if chapter != len(verses):
+        raise ValueError('Canon file has %d chapters more than its books' % (len(verses) - chapter))
+    return versification, canon
+
+
+def validate_canon(versification, canon):
+    '''Raises ValueError if canon differs from the builtin canon of the same versification.'''
+    if versification not in versifications:
+        return
+    builtin = get_canon(versification)
+    for testament in ('ot', 'nt'):
+        if len(canon[testament]) != len(builtin[testament]):
+            raise ValueError('Canon %s has %d books in %s, expected %d' %
+                             (versification, len(canon[testament]), testament, len(builtin[testament])))
+        for book, builtin_book in zip(canon[testament], builtin[testament]):
+            if tuple(book[:3]) != tuple(builtin_book[:3]) or list(book[3]) != list(builtin_book[3]):
+                raise ValueError('Canon %s differs from the builtin canon in book %s' % (versification, book[0]))
+
+
+def load_canon_file(path, validate=True):
+    '''Load and register a canon from a binary canon file, returns its versification. Canons of builtin
+    versifications are validated against the builtin tables.
+    '''
+    with open(path, 'rb') as canon_file:
+        versification, canon = unpack_canon(canon_file.read())
+    if validate:
+        validate_canon(versification, canon)
+    register_canon(versification, canon)
+    return versification
+
+
+def __getattr__(name):
+    if name in versifications:
+        return get_canon(name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
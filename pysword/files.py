@@ -0,0 +1,250 @@
+###############################################################################
+# PySword - A native Python reader of the SWORD Project Bible Modules         #
+# --------------------------------------------------------------------------- #
+# Copyright (c) 2008-2015 Various developers:                                 #
+# Kenneth Arnold, Joshua Gross, Ryan Hiebert, Matthew Wardrop, Tomas Groth    #
+# --------------------------------------------------------------------------- #
+# This program is free software; you can redistribute it and/or modify it     #
+# under the terms of the GNU General Public License as published by the Free  #
+# Software Foundation; version 2 of the License.                              #
+#                                                                             #
+# This program is distributed in the hope that it will be useful, but WITHOUT #
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or       #
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for    #
+# more details.                                                               #
+#                                                                             #
+# You should have received a copy of the GNU General Public License along     #
+# with this program; if not, write to the Free Software Foundation, Inc., 59  #
+# Temple Place, Suite 330, Boston, MA 02111-1307 USA                          #
+###############################################################################
+
+import mmap
+import os
+import struct
+import threading
+import weakref
+import zipfile
+from collections import OrderedDict
+
+
+class FilePool(object):
+    '''Keeps the files of FileReaders open, but at most max_open of them at a time. When the limit is
+    reached the least recently used file that is not being read from is closed, it is reopened when it
+    is needed again. The pool only holds weak references to the readers, the file of a reader that is
+    garbage collected without being closed is closed too. The pool can be used from several threads.
+    '''
+
+    def __init__(self, max_open=256):
+        self.max_open = max_open
+        self.__files = OrderedDict()  # weak reference to reader -> [file, number of users, the reference]
+        self.__lock = threading.Lock()
+        # References of garbage collected readers whose files are still to be closed
+        self.__dead = []
+
+    def __len__(self):
+        with self.__lock:
+            self.__close_dead()
+            return len(self.__files)
+
+    def __forget(self, reference):
+        '''Close the file of a garbage collected reader.'''
+        self.__dead.append(reference)
+        # The reader may be collected in a thread holding the lock, its file is then closed on the next use
+        # of the pool
+        if self.__lock.acquire(blocking=False):
+            try:
+                self.__close_dead()
+            finally:
+                self.__lock.release()
+
+    def __close_dead(self):
+        while self.__dead:
+            entry = self.__files.pop(self.__dead.pop(), None)
+            if entry is not None:
+                entry[0].close()
+
+    def acquire(self, reader):
+        '''Returns the open file of reader, opening it if needed. The file is not closed by the pool until
+        release() is called.
+        '''
+        with self.__lock:
+            self.__close_dead()
+            # A weak reference is equal to the other references of the same reader
+            entry = self.__files.pop(weakref.ref(reader), None)
+            if entry is None:
+                for old_reference in list(self.__files):
+                    if len(self.__files) < self.max_open:
+                        break
+                    if self.__files[old_reference][1] == 0:
+                        self.__files.pop(old_reference)[0].close()
+                entry = [open(reader.path, 'rb'), 0, weakref.ref(reader, self.__forget)]
+            entry[1] += 1
+            self.__files[entry[2]] = entry
+            return entry[0]
+
+    def release(self, reader):
+        '''Mark that the file of reader returned by acquire() is no longer used.'''
+        with self.__lock:
+            entry = self.__files.get(weakref.ref(reader))
+            if entry is not None:
+                entry[1] -= 1
+
+    def close(self, reader):
+        '''Close the file of reader if it is open.'''
+        with self.__lock:
+            entry = self.__files.pop(weakref.ref(reader), None)
+            if entry is not None:
+                entry[0].close()
+
+
+# The pool shared by all FileReaders that are not given one
+file_pool = FilePool()
+
+
+class FileReader(object):
+    '''Reads byte ranges of a file. If offset and size are given, only that part of the file is
+    exposed, as if it was the whole file. The file is only opened when it is first read, and is kept
+    open by a FilePool. Reads are positional (os.pread) where supported, so a reader can be shared by
+    several threads; elsewhere seek() and read() are serialized with a lock.
+    '''
+
+    def __init__(self, path, offset=0, size=None, pool=None):
+        # Fail early if the file does not exist
+        os.stat(path)
+        self.path = path
+        self.__offset = offset
+        self.__size = size
+        self.__pool = file_pool if pool is None else pool
+        self.__closed = False
+        self.__lock = threading.Lock()
+
+    def __read(self, offset, size):
+        if self.__closed:
+            raise ValueError('Read from closed reader of %s' % self.path)
+        f = self.__pool.acquire(self)
+        try:
+            if hasattr(os, 'pread'):
+                chunks = []
+                while size > 0:
+                    chunk = os.pread(f.fileno(), size, offset)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                    offset += len(chunk)
+                    size -= len(chunk)
+                return b''.join(chunks)
+            with self.__lock:
+                f.seek(offset)
+                return f.read(size)
+        finally:
+            self.__pool.release(self)
+
+    def read(self, offset, size):
+        if self.__size is not None:
+            size = max(0, min(size, self.__size - offset))
+        return self.__read(self.__offset + offset, size)
+
+    def read_all(self):
+        if self.__size is None:
+            return self.read(0, os.stat(self.path).st_size - self.__offset)
+        return self.read(0, self.__size)
+
+    def close(self):
+        self.__closed = True
+        self.__pool.close(self)
+
+
+class MmapReader(object):
+    '''Reads byte ranges of a memory-mapped file. Ranges are returned as zero-copy memoryview
+    slices of the mapping, so reading does not involve any system calls. If offset and size are
+    given, only that part of the file is exposed, as if it was the whole file. The file is mapped
+    when it is first read, the mapping does not keep a file descriptor open.
+    '''
+
+    def __init__(self, path, offset=0, size=None):
+        # Fail early if the file does not exist
+        os.stat(path)
+        self.path = path
+        self.__offset = offset
+        self.__size = size
+        self.__map = None
+        self.__view = None
+        self.__lock = threading.Lock()
+
+    def __get_view(self):
+        if self.__view is not None:
+            return self.__view
+        with self.__lock:
+            if self.__view is not None:
+                return self.__view
+            if self.__map is not None:
+                raise ValueError('Read from closed reader of %s' % self.path)
+            with open(self.path, 'rb') as f:
+                try:
+                    self.__map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # Empty files cannot be mapped
+                    self.__map = b''
+            if self.__size is None:
+                self.__view = memoryview(self.__map)[self.__offset:]
+            else:
+                self.__view = memoryview(self.__map)[self.__offset:self.__offset+self.__size]
+            return self.__view
+
+    def read(self, offset, size):
+        return self.__get_view()[offset:offset+size]
+
+    def read_all(self):
+        return self.__get_view()
+
+    def close(self):
+        if self.__view is not None:
+            self.__view.release()
+            self.__view = None
+            try:
+                self.__map.close()
+            except (AttributeError, BufferError):
+                # Empty files have no real mapping, and slices still in use keep the mapping alive;
+                # it is then unmapped once they are garbage collected.
+                pass
+        self.__map = False
+
+
+class MemoryReader(object):
+    '''Reads byte ranges of data held in memory.'''
+
+    def __init__(self, data, path=None):
+        self.path = path
+        self.__view = memoryview(data)
+
+    def read(self, offset, size):
+        return self.read_all()[offset:offset+size]
+
+    def read_all(self):
+        if self.__view is None:
+            raise ValueError('Read from closed reader of %s' % self.path)
+        return self.__view
+
+    def close(self):
+        self.__view = None
+
+
+def open_zip_member(zip_file, name, reader_class=FileReader):
+    '''Returns a reader for a member of an open zipfile.ZipFile. Stored (uncompressed) members are read
+    in place from the archive using reader_class, other members are decompressed once into memory.
+    '''
+    try:
+        info = zip_file.getinfo(name)
+    except KeyError:
+        raise FileNotFoundError('No member %s in %s' % (name, zip_file.filename))
+    if info.compress_type == zipfile.ZIP_STORED and not info.flag_bits & 0x1:
+        # The data starts after the local file header, whose extra field may differ from the one in the
+        # central directory, so it has to be read.
+        with open(zip_file.filename, 'rb') as archive:
+            archive.seek(info.header_offset)
+            header = archive.read(30)
+        signature, name_len, extra_len = struct.unpack('<4s22xHH', header)
+        if signature != b'PK\x03\x04':
+            raise OSError('Bad local file header for %s in %s' % (name, zip_file.filename))
+        return reader_class(zip_file.filename, info.header_offset + 30 + name_len + extra_len, info.file_size)
+    return MemoryReader(zip_file.read(name), name)
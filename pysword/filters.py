@@ -0,0 +1,198 @@
+###############################################################################
+# PySword - A native Python reader of the SWORD Project Bible Modules         #
+# --------------------------------------------------------------------------- #
+# Copyright (c) 2008-2015 Various developers:                                 #
+# Kenneth Arnold, Joshua Gross, Ryan Hiebert, Matthew Wardrop, Tomas Groth    #
+# --------------------------------------------------------------------------- #
+# This program is free software; you can redistribute it and/or modify it     #
+# under the terms of the GNU General Public License as published by the Free  #
+# Software Foundation; version 2 of the License.                              #
+#                                                                             #
+# This program is distributed in the hope that it will be useful, but WITHOUT #
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or       #
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for    #
+# more details.                                                               #
+#                                                                             #
+# You should have received a copy of the GNU General Public License along     #
+# with this program; if not, write to the Free Software Foundation, Inc., 59  #
+# Temple Place, Suite 330, Boston, MA 02111-1307 USA                          #
+###############################################################################
+
+# Filters removing the OSIS, GBF and ThML markup from the text of verses.
+#
+# The filter works on the undecoded verse text, which is fine for the ASCII compatible encodings used by
+# SWORD modules (UTF-8 and Latin-1), and keeps its state between verses, so elements spanning a verse
+# boundary (eg. a note or a tag split over two verses) are handled correctly. Broken markup, like a
+# stray '<' or a note that is never closed, only affects a few verses: incomplete tags are carried to the
+# next verse up to a limit, and notes and words are closed after a number of verses.
+
+import re
+
+from .search import strongs_number
+
+
+class MarkupFilterMode:
+    PLAIN = 'plain'  # Only the text, notes are removed
+    STRONGS = 'strongs'  # The text, with the Strong's numbers of words like 'God [H430]'
+    FOOTNOTES = 'footnotes'  # The text, with the content of notes in brackets like 'word [note]'
+
+
+_token_re = re.compile(rb'<[^<>]*>|&#?\w+;|[^<&]+|<[A-Za-z/!?][^<>]*$|&#?\w*$|[<&]')
+_tag_name_re = re.compile(rb'</?\s*([\w:]+)')
+_lemma_re = re.compile(rb'lemma\s*=\s*"([^"]*)"')
+_sync_re = re.compile(rb'type\s*=\s*"Strongs"[^>]*value\s*=\s*"([^"]*)"|value\s*=\s*"([^"]*)"[^>]*type\s*=\s*"Strongs"')
+_gbf_strongs_re = re.compile(rb'^<W([HG]\d+[a-z]?)>$')
+
+_entities = {b'&amp;': b'&', b'&lt;': b'<', b'&gt;': b'>', b'&quot;': b'"', b'&apos;': b"'", b'&nbsp;': b' '}
+# Tags separating words
+_break_tags = {b'lb', b'br', b'p', b'CM', b'CL', b'l'}
+# Longest incomplete tag or entity carried to the next verse, longer ones are taken as text
+_max_pending = 4096
+# Number of verses notes and words can stay open, they are closed after that
+_max_open_verses = 4
+
+
+def _strongs(values):
+    '''Normalized Strong's numbers (eg. b'H430') in a list of lemma values.'''
+    numbers = []
+    for value in values:
+        # Strong's numbers are ASCII, Latin-1 decodes any value to compare them
+        number = strongs_number(value.decode('latin-1'))
+        if number:
+            numbers.append(number.encode('ascii'))
+    return numbers
+
+
+class MarkupFilter(object):
+    '''A single-pass incremental filter removing markup, see MarkupFilterMode for the modes. Feed it the
+    undecoded verses in order, it returns the filtered text of each.
+    '''
+
+    def __init__(self, mode=MarkupFilterMode.PLAIN, encoding='utf-8'):
+        if mode not in (MarkupFilterMode.PLAIN, MarkupFilterMode.STRONGS, MarkupFilterMode.FOOTNOTES):
+            raise ValueError('Invalid markup filter mode: %s' % mode)
+        self.mode = mode
+        self.encoding = encoding
+        self.reset()
+
+    def reset(self):
+        self.__pending = b''  # An incomplete tag or entity at the end of the last verse
+        self.__note_depth = 0  # Number of open notes
+        self.__words = ()  # Strong's numbers of the open <w> elements
+        self.__open_verses = 0  # Number of verses ended with notes or words open
+
+    @property
+    def state(self):
+        '''The state carried between verses, as a hashable value.'''
+        return self.__pending, self.__note_depth, self.__words, self.__open_verses
+
+    @state.setter
+    def state(self, state):
+        self.__pending, self.__note_depth, self.__words, self.__open_verses = state
+
+    def feed(self, data, final=False):
+        '''Filter the text of the next verse. If final is true, the verse is the last one of a passage: an
+        incomplete tag or entity at its end is taken as text, and the filter is reset afterwards (this is
+        the same as calling flush() after the verse).
+        '''
+        if self.__open_verses >= _max_open_verses:
+            # Most likely broken markup, don't let it hide the text of the following verses
+            self.__note_depth = 0
+            self.__words = ()
+            self.__open_verses = 0
+        if self.__pending:
+            data = self.__pending + bytes(data)
+            self.__pending = b''
+        output = []
+        keep_notes = self.mode == MarkupFilterMode.FOOTNOTES
+        for match in _token_re.finditer(data):
+            token = match.group()
+            first = token[:1]
+            if first == b'<' and token.endswith(b'>'):
+                self.__tag(token, output)
+            elif first in (b'<', b'&') and not token.endswith(b';') and match.end() == len(data) and \
+                    len(token) <= _max_pending:
+                # An incomplete tag or entity, it continues in the next verse
+                self.__pending = token
+            elif not self.__note_depth or keep_notes:
+                if first == b'&':
+                    token = self.__entity(token)
+                output.append(token)
+        if final:
+            output.append(self.flush())
+        elif self.__note_depth or self.__words:
+            self.__open_verses += 1
+        else:
+            self.__open_verses = 0
+        return b''.join(output)
+
+    def flush(self):
+        '''End the passage: returns an incomplete tag or entity held back from the last verse as text, and
+        resets the filter.
+        '''
+        pending = self.__pending
+        if pending and self.__note_depth and self.mode != MarkupFilterMode.FOOTNOTES:
+            pending = b''
+        elif pending.startswith(b'&'):
+            pending = self.__entity(pending)
+        self.reset()
+        return pending
+
+    def __entity(self, entity):
+        if entity in _entities:
+            return _entities[entity]
+        if entity.startswith(b'&#'):
+            try:
+                if entity[2:3] in (b'x', b'X'):
+                    code = int(entity[3:-1], 16)
+                else:
+                    code = int(entity[2:-1])
+                return chr(code).encode(self.encoding, errors='xmlcharrefreplace')
+            except (ValueError, OverflowError):
+                pass
+        return entity
+
+    def __tag(self, tag, output):
+        match = _tag_name_re.match(tag)
+        if match is None:
+            return
+        name = match.group(1)
+        closing = tag.startswith(b'</')
+        self_closing = tag.endswith(b'/>')
+        in_note = self.__note_depth > 0
+        # Notes: OSIS and ThML <note>, GBF <RF>..<Rf>
+        if name == b'note' and not self_closing or name in (b'RF', b'Rf'):
+            if closing or name == b'Rf':
+                if self.__note_depth:
+                    self.__note_depth -= 1
+                    if self.mode == MarkupFilterMode.FOOTNOTES:
+                        output.append(b']')
+            else:
+                self.__note_depth += 1
+                if self.mode == MarkupFilterMode.FOOTNOTES:
+                    output.append(b' [')
+            return
+        if in_note and self.mode != MarkupFilterMode.FOOTNOTES:
+            return
+        if name in _break_tags:
+            output.append(b' ')
+        elif self.mode != MarkupFilterMode.STRONGS:
+            return
+        elif name == b'w' and not self_closing:
+            # The Strong's numbers of OSIS words are added after the word
+            if closing:
+                if self.__words:
+                    numbers = self.__words[-1]
+                    self.__words = self.__words[:-1]
+                    output.extend(b' [%s]' % number for number in numbers)
+            else:
+                lemma = _lemma_re.search(tag)
+                self.__words += (tuple(_strongs(lemma.group(1).split()) if lemma else ()),)
+        elif name == b'sync':
+            sync = _sync_re.search(tag)
+            if sync:
+                output.extend(b' [%s]' % number for number in _strongs([sync.group(1) or sync.group(2)]))
+        else:
+            gbf = _gbf_strongs_re.match(tag)
+            if gbf:
+                output.extend(b' [%s]' % number for number in _strongs([gbf.group(1)]))
@@ -19,66 +19,323 @@
 ###############################################################################
 
 import os
+import collections
+import json
+import posixpath
 import configparser
-import zipfile
 import tempfile
-import shutil
+import threading
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from .bible import SwordBible
+from .books import get_structure
+
+# A row of SwordModules.get_parallel: a verse and its text in each of the modules, None where a module
+# does not have the verse
+ParallelVerse = collections.namedtuple('ParallelVerse', ['book', 'chapter', 'verse', 'texts'])
+
+
+def _parse_conf(conf):
+    '''Parse a config file, conf is (filename, contents). Returns {'module', 'config'}, or the error message
+    if the file cannot be parsed. This runs in worker processes, see SwordModules.parse_modules.
+    '''
+    conf_filename, conf_text = conf
+    try:
+        config = configparser.ConfigParser(strict=False)
+        config.read_string(conf_text, conf_filename)
+        module_name = config.sections()[0]
+        return {'module': module_name, 'config': dict(config[module_name])}
+    except Exception as e:
+        return str(e)
 
 
 class SwordModules(object):
 
-    def __init__(self, path=None):
+    def __init__(self, path=None, catalog_path=None):
+        '''Find modules in path, a SWORD folder or a zipfile. If catalog_path is given, the parsed config
+        files are cached in that file and only config files that changed since are parsed again.
+        '''
         if path is None:
             self.__sword_path = os.path.join(os.environ['HOME'], '.sword')
         else:
             self.__sword_path = path
+        self.__catalog_path = catalog_path
         self.__modules = {}
-        self.__temp_folder = None
-
-    def __del__(self):
-        if self.__temp_folder:
-            shutil.rmtree(self.__temp_folder)
+        self.__zip_file = None
+        # Futures of the bibles opened by get_parallel, by module key, and the threads reading them
+        self.__bibles = {}
+        self.__bibles_lock = threading.Lock()
+        self.__executor = None
 
-    def parse_modules(self):
-        # If path is a zipfile, we extract it to a temp-folder
+    def __conf_files(self):
+        '''Returns a list of (filename, key, function returning the contents) of the config files. The key
+        changes when the file changes.
+        '''
+        # If path is a zipfile, the modules are read directly from it
         if self.__sword_path.endswith('.zip'):
-            self.__temp_folder = tempfile.mkdtemp()
-            zipped_module = zipfile.ZipFile(self.__sword_path)
-            zipped_module.extractall(self.__temp_folder)
-            conf_folder = os.path.join(self.__temp_folder, 'mods.d')
-        else:
-            conf_folder = os.path.join(self.__sword_path, 'mods.d')
-        # Loop over config files and save data in a dict
+            if self.__zip_file is None:
+                self.__zip_file = zipfile.ZipFile(self.__sword_path)
+            zip_file = self.__zip_file
+            return [(info.filename, [info.CRC, info.file_size],
+                     lambda name=info.filename: zip_file.read(name).decode('utf-8', errors='replace'))
+                    for info in zip_file.infolist()
+                    if posixpath.dirname(posixpath.normpath(info.filename)) == 'mods.d' and
+                    info.filename.endswith('.conf')]
+        conf_folder = os.path.join(self.__sword_path, 'mods.d')
+        conf_files = []
         for f in os.listdir(conf_folder):
             if f.endswith('.conf'):
                 conf_filename = os.path.join(conf_folder, f)
-                config = configparser.ConfigParser(strict=False)
-                try:
-                    conf_file = open(conf_filename, 'rt', errors='replace')
-                    config.read_string(conf_file.read(), conf_filename)
-                except Exception as e:
-                    print('Exception while parsing %s' % f)
-                    print(e)
-                    continue
-                module_name = config.sections()[0]
-                self.__modules[module_name] = dict(config[module_name])
+                stat = os.stat(conf_filename)
+
+                def read_conf_file(conf_filename=conf_filename):
+                    with open(conf_filename, 'rt', errors='replace') as conf_file:
+                        return conf_file.read()
+                conf_files.append((conf_filename, [stat.st_mtime_ns, stat.st_size], read_conf_file))
+        return conf_files
+
+    def __load_catalog(self):
+        '''Returns the cached config files as a dict: filename -> {'key', 'module', 'config'}'''
+        if self.__catalog_path is None:
+            return {}
+        try:
+            with open(self.__catalog_path, 'rt', encoding='utf-8') as catalog_file:
+                catalog = json.load(catalog_file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(catalog, dict) or catalog.get('path') != os.path.abspath(self.__sword_path) or \
+                not isinstance(catalog.get('confs'), dict):
+            return {}
+        # Entries that are not valid are parsed again
+        return dict((conf_filename, conf) for conf_filename, conf in catalog['confs'].items()
+                    if isinstance(conf, dict) and 'key' in conf and isinstance(conf.get('module'), str) and
+                    isinstance(conf.get('config'), dict))
+
+    def __save_catalog(self, confs):
+        # A temporary file of its own, as other processes may be saving the same catalog
+        tmp_fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(self.__catalog_path) + '.', suffix='.tmp',
+                                            dir=os.path.dirname(os.path.abspath(self.__catalog_path)))
+        try:
+            with open(tmp_fd, 'wt', encoding='utf-8') as catalog_file:
+                json.dump({'path': os.path.abspath(self.__sword_path), 'confs': confs}, catalog_file)
+            os.replace(tmp_path, self.__catalog_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def parse_modules(self, workers=None):
+        '''Find the modules and return a dict with module ID and description. If workers is given, the
+        config files are parsed in a pool of that many processes. Parsing is pure Python, so threads would
+        not run it in parallel; starting the processes takes some time, so this pays off for large
+        collections of modules only. Processes are only used where they are forked (the default start
+        method on Linux before Python 3.14); started any other way they would import the main module
+        again, running scripts without an "if __name__ == '__main__':" guard once more, so the config
+        files are parsed serially instead.
+        '''
+        # Loop over config files and save data in a dict, reusing the cached data of unchanged files
+        catalog = self.__load_catalog()
+        conf_files = self.__conf_files()
+        parsed = {}
+        changed_confs = []
+        for conf_filename, conf_key, read_conf_file in conf_files:
+            if conf_filename in catalog and catalog[conf_filename]['key'] == conf_key:
+                continue
+            try:
+                changed_confs.append((conf_filename, read_conf_file()))
+            except Exception as e:
+                parsed[conf_filename] = str(e)
+        results = None
+        if workers and len(changed_confs) > 1:
+            # Imported here, as multiprocessing is slow to import
+            import multiprocessing
+            if multiprocessing.get_start_method() == 'fork':
+                from concurrent.futures import ProcessPoolExecutor
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(_parse_conf, changed_confs,
+                                                chunksize=max(1, len(changed_confs) // (workers * 4))))
+        if results is None:
+            results = [_parse_conf(conf) for conf in changed_confs]
+        parsed.update(zip([conf_filename for conf_filename, conf_text in changed_confs], results))
+        confs = {}
+        for conf_filename, conf_key, read_conf_file in conf_files:
+            conf = parsed.get(conf_filename, catalog.get(conf_filename))
+            if isinstance(conf, str):
+                print('Exception while parsing %s' % os.path.basename(conf_filename))
+                print(conf)
+                continue
+            if conf_filename in parsed:
+                conf['key'] = conf_key
+            confs[conf_filename] = conf
+            self.__modules[conf['module']] = conf['config']
+        if self.__catalog_path is not None and confs != catalog:
+            self.__save_catalog(confs)
         # Create a simple dict with module ID and description and return it
         mods = {}
         for key in self.__modules.keys():
             mods[key] = self.__modules[key]['description']
         return mods
 
-    def get_bible_from_module(self, module_key):
+    def __versification(self, module_key):
+        try:
+            return self.__modules[module_key]['versification'].lower()
+        except KeyError:
+            return 'default'
+
+    def get_bible_from_module(self, module_key, **kwargs):
+        '''Open the bible with the given module key. Extra keyword arguments are passed on to SwordBible.'''
         bible_module = self.__modules[module_key]
-        if self.__temp_folder:
-            module_path = os.path.join(self.__temp_folder, bible_module['datapath'])
+        if self.__zip_file is not None:
+            module_path = posixpath.normpath(bible_module['datapath'])
+            kwargs['zip_file'] = self.__zip_file
         else:
             module_path = os.path.join(self.__sword_path, bible_module['datapath'])
         module_type = bible_module['moddrv'].lower()
-        try:
-            module_versification = bible_module['versification'].lower()
-        except KeyError:
-            module_versification = 'default'
-        return SwordBible(module_path, module_type, module_versification)
+        module_versification = self.__versification(module_key)
+        kwargs.setdefault('encoding', bible_module.get('encoding'))
+        return SwordBible(module_path, module_type, module_versification, **kwargs)
+
+    def get_bibles(self, module_keys, workers=None, **kwargs):
+        '''Open several bibles, returns a dict of module key -> SwordBible. If workers is given, the bibles
+        are opened in a pool of that many threads. Extra keyword arguments are passed on to SwordBible.
+        '''
+        def open_bible(module_key):
+            return self.get_bible_from_module(module_key, **kwargs)
+        if workers:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return dict(zip(module_keys, executor.map(open_bible, module_keys)))
+        return dict((module_key, open_bible(module_key)) for module_key in module_keys)
+
+    def get_parallel(self, reference, module_keys, workers=None, filter_mode=None):
+        '''Get the text of a reference in several modules, for showing translations side by side. reference
+        is a tuple of (books, chapters, verses) as given to SwordBible.get, eg. ('john', 3, None).
+        Returns a list of ParallelVerse rows of (book name, chapter, verse, texts), where texts has the text
+        of the verse in each of module_keys, in order, or None if the module does not have the verse.
+        The reference is resolved once for each versification, and the modules are read in a pool of
+        workers threads at a time (by default one per module), taken from a pool kept by the modules. The
+        bibles are opened on first use and kept open until close() is called.
+        '''
+        books, chapters, verses = (tuple(reference) + (None, None))[:3]
+        # Resolve the reference once per versification; a book may not exist in every versification
+        refs = {}
+        for module_key in module_keys:
+            versification = self.__versification(module_key)
+            if versification not in refs:
+                try:
+                    refs[versification] = get_structure(versification).ref_to_indicies_and_references(
+                        books=books, chapters=chapters, verses=verses)
+                except ValueError:
+                    refs[versification] = None
+        if all(versification_refs is None for versification_refs in refs.values()):
+            raise ValueError('Reference %r does not exist in the versifications of the modules.' % (reference,))
+
+        def read_module(module_key):
+            versification_refs = refs[self.__versification(module_key)]
+            if versification_refs is None:
+                return []
+            bible = self.__parallel_bible(module_key)
+            # Skip the testaments the module does not have, eg. in NT only modules
+            versification_refs = dict((testament, testament_refs) for testament, testament_refs
+                                      in versification_refs.items() if testament in bible.testaments)
+            return list(bible.getiter_references(versification_refs, filter_mode=filter_mode))
+
+        module_verses = self.__map(read_module, module_keys, workers)
+        # Align the verses by reference, in the order of the references
+        rows = collections.OrderedDict((reference, [None] * len(module_keys))
+                                       for reference in self.__merge_references(refs.values()))
+        for column, verses_of_module in enumerate(module_verses):
+            for verse in verses_of_module:
+                rows[verse[:3]][column] = verse.text
+        return [ParallelVerse(book, chapter, verse, texts) for (book, chapter, verse), texts in rows.items()]
+
+    def __parallel_bible(self, module_key):
+        '''Returns the bible of module_key for get_parallel, opening it on first use. A bible is opened
+        once; other threads wanting the same bible wait for it, while other bibles open meanwhile.
+        '''
+        with self.__bibles_lock:
+            future = self.__bibles.get(module_key)
+            opening = future is None
+            if opening:
+                future = self.__bibles[module_key] = Future()
+        if opening:
+            try:
+                future.set_result(self.get_bible_from_module(module_key))
+            except Exception as e:
+                # Let a later call try again
+                with self.__bibles_lock:
+                    del self.__bibles[module_key]
+                future.set_exception(e)
+        return future.result()
+
+    def __map(self, function, items, workers=None):
+        '''Returns [function(item) for item in items], run in the pool of threads of the modules, in at most
+        workers threads at a time (by default one per item).
+        '''
+        items = list(items)
+        results = [None] * len(items)
+        positions = iter(range(len(items)))
+        positions_lock = threading.Lock()
+
+        def work():
+            while True:
+                with positions_lock:
+                    position = next(positions, None)
+                if position is None:
+                    return
+                results[position] = function(items[position])
+
+        with self.__bibles_lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(thread_name_prefix='pysword-parallel')
+            executor = self.__executor
+        futures = [executor.submit(work) for i in range(min(workers or len(items), len(items)))]
+        for future in futures:
+            future.result()
+        return results
+
+    @staticmethod
+    def __merge_references(versification_refs):
+        '''Returns the (book name, chapter, verse) references of resolved references of several
+        versifications in order. References missing in the first versification are put after the
+        reference preceding them in their own versification.
+        '''
+        order = []
+        known = set()
+        for refs in versification_refs:
+            if refs is None:
+                continue
+            # New references by the known reference they follow (None at the start)
+            following = collections.OrderedDict()
+            previous = None
+            for testament_refs in refs.values():
+                for reference in testament_refs[1]:
+                    if reference in known:
+                        previous = reference
+                    else:
+                        following.setdefault(previous, []).append(reference)
+            if not following:
+                continue
+            merged = following.get(None, [])
+            for reference in order:
+                merged.append(reference)
+                merged.extend(following.get(reference, ()))
+            order = merged
+            known.update(order)
+        return order
+
+    def close(self):
+        '''Close the bibles opened by get_parallel, their threads, and the zipfile the modules are read
+        from.
+        '''
+        with self.__bibles_lock:
+            futures = list(self.__bibles.values())
+            self.__bibles.clear()
+            executor, self.__executor = self.__executor, None
+        if executor is not None:
+            executor.shutdown()
+        for future in futures:
+            if future.done() and future.exception() is None:
+                future.result().close()
+        if self.__zip_file is not None:
+            self.__zip_file.close()
+            self.__zip_file = None
@@ -0,0 +1,409 @@
+###############################################################################
+# PySword - A native Python reader of the SWORD Project Bible Modules         #
+# --------------------------------------------------------------------------- #
+# Copyright (c) 2008-2015 Various developers:                                 #
+# Kenneth Arnold, Joshua Gross, Ryan Hiebert, Matthew Wardrop, Tomas Groth    #
+# --------------------------------------------------------------------------- #
+# This program is free software; you can redistribute it and/or modify it     #
+# under the terms of the GNU General Public License as published by the Free  #
+# Software Foundation; version 2 of the License.                              #
+#                                                                             #
+# This program is distributed in the hope that it will be useful, but WITHOUT #
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or       #
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for    #
+# more details.                                                               #
+#                                                                             #
+# You should have received a copy of the GNU General Public License along     #
+# with this program; if not, write to the Free Software Foundation, Inc., 59  #
+# Temple Place, Suite 330, Boston, MA 02111-1307 USA                          #
+###############################################################################
+
+# Full-text and lemma search in bible modules.
+#
+# The indexes are inverted indexes of the verses of a module, each kept in a single file. An index has a
+# section per testament, each holding the fingerprint of the module files it was built from, a dictionary
+# of terms and the posting lists of the terms. Posting lists are sequences of varints:
+#   - SearchIndex (full-text, positional): the number of verses, then for each verse the verse index (delta
+#     to the previous verse), the number of positions of the term in the verse and the positions (delta to
+#     the previous position).
+#   - LemmaIndex (Strong's numbers, lemmas and morphology codes of tagged modules): the verse indicies
+#     (delta to the previous verse).
+#
+# File format: magic (b'PSWI' or b'PSWL'), version ('<H'), length of the header ('<I'), the header as utf-8
+# JSON ({testament: {'fingerprint': ..., 'terms': {term: [offset, length]}, 'offset': ..., 'size': ...}})
+# and the posting lists of all sections.
+#
+# Full-text queries consist of words, "quoted phrases", AND (the default), OR, NOT (or a leading -) and
+# parentheses.
+
+import json
+import os
+import re
+import tempfile
+
+INDEX_FILE_VERSION = 1
+
+_markup_re = re.compile(r'<[^>]*>')
+# Tags with lemma and morphology: OSIS <w lemma=".." morph="..">, ThML <sync type=".." value="..">
+# and GBF <WH0430>, <WTV-PAI> (Strong's numbers and morphology)
+_lemma_tag_re = re.compile(r'<(w|sync)\s([^>]*)>|<W([HG]\d+[a-z]?)>|<WT([^>]+)>')
+_attribute_re = re.compile(r'(\w+)\s*=\s*"([^"]*)"')
+_strongs_re = re.compile(r'^(?:strongs?:)?([HG])0*(\d+)([a-z]?)$', re.IGNORECASE)
+_word_re = re.compile(r'\w+')
+_query_re = re.compile(r'(-)?"([^"]*)"|(\()|(\))|(-)?([^\s()"]+)|(")')
+
+
+def encode_varints(numbers):
+    '''Encode non-negative integers as LEB128 varints.'''
+    data = bytearray()
+    for number in numbers:
+        while number >= 0x80:
+            data.append((number & 0x7f) | 0x80)
+            number >>= 7
+        data.append(number)
+    return bytes(data)
+
+
+def decode_varints(data):
+    '''Decode a sequence of LEB128 varints.'''
+    numbers = []
+    number = 0
+    shift = 0
+    for byte in data:
+        number |= (byte & 0x7f) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            numbers.append(number)
+            number = 0
+            shift = 0
+    return numbers
+
+
+def tokenize(text):
+    '''Split the text of a verse into case-folded words, ignoring markup.'''
+    return _word_re.findall(_markup_re.sub(' ', text).casefold())
+
+
+def strongs_number(lemma):
+    '''Returns the Strong's number of a lemma as a letter and a number without leading zeros
+    ('strong:H0430' and 'h430' give 'H430'), or None if the lemma is not a Strong's number.
+    '''
+    match = _strongs_re.match(lemma)
+    if match is None:
+        return None
+    return '%s%d%s' % (match.group(1).upper(), int(match.group(2)), match.group(3))
+
+
+def normalize_lemma(lemma):
+    '''Normalize Strong's numbers, see strongs_number. Other lemmas and morphology codes are returned
+    unchanged.
+    '''
+    return strongs_number(lemma) or lemma
+
+
+def extract_lemmas(text):
+    '''Returns the set of normalized lemmas and morphology codes in the markup of a verse.'''
+    lemmas = set()
+    for tag, attributes, gbf_strongs, gbf_morph in _lemma_tag_re.findall(text):
+        if gbf_strongs:
+            lemmas.add(normalize_lemma(gbf_strongs))
+        elif gbf_morph:
+            lemmas.add(gbf_morph)
+        else:
+            attributes = dict(_attribute_re.findall(attributes))
+            if tag == 'w':
+                values = attributes.get('lemma', '').split() + attributes.get('morph', '').split()
+            else:
+                values = [attributes.get('value', '')]
+            lemmas.update(normalize_lemma(value) for value in values if value)
+    return lemmas
+
+
+class PostingIndex(object):
+    '''Storage of an inverted index with a section per testament, see the top of this module.'''
+
+    file_magic = None
+
+    def __init__(self, path):
+        self.path = path
+        self.__sections = {}
+        self.__data = {}
+        try:
+            with open(path, 'rb') as index_file:
+                data = index_file.read()
+        except OSError:
+            return
+        if data[:4] != self.file_magic or int.from_bytes(data[4:6], 'little') != INDEX_FILE_VERSION:
+            return
+        header_size = int.from_bytes(data[6:10], 'little')
+        blob = memoryview(data)[10+header_size:]
+        sections = {}
+        try:
+            for testament, section in json.loads(data[10:10+header_size].decode('utf-8')).items():
+                offset, size = section['offset'], section['size']
+                if offset + size > len(blob) or not isinstance(section['terms'], dict) or \
+                        'fingerprint' not in section:
+                    raise ValueError('Truncated index section %s' % testament)
+                sections[testament] = section
+                self.__data[testament] = blob[offset:offset+size]
+        except (ValueError, KeyError, TypeError, AttributeError):
+            # A corrupt or truncated index is built again, like an index of an older version
+            self.__data = {}
+            return
+        self.__sections = sections
+
+    def is_current(self, testament, fingerprint):
+        '''Whether the section of testament was built from module files with the given fingerprint.'''
+        return testament in self.__sections and self.__sections[testament]['fingerprint'] == fingerprint
+
+    def testaments(self):
+        return list(self.__sections)
+
+    def remove_section(self, testament):
+        self.__sections.pop(testament, None)
+        self.__data.pop(testament, None)
+
+    def _store_section(self, testament, fingerprint, postings):
+        '''Store a section from a dict of term -> list of numbers of its posting list.'''
+        terms = {}
+        data = bytearray()
+        for term in sorted(postings):
+            encoded = encode_varints(postings[term])
+            terms[term] = [len(data), len(encoded)]
+            data += encoded
+        self.__sections[testament] = {'fingerprint': fingerprint, 'terms': terms}
+        self.__data[testament] = memoryview(bytes(data))
+
+    def _posting_list(self, testament, term):
+        '''Returns the numbers of the posting list of term, an empty list if the term is not found.'''
+        location = self.__sections[testament]['terms'].get(term)
+        if location is None:
+            return []
+        offset, size = location
+        return decode_varints(self.__data[testament][offset:offset+size])
+
+    def save(self):
+        '''Write the index to its file.'''
+        sections = {}
+        blobs = []
+        offset = 0
+        for testament, section in self.__sections.items():
+            size = len(self.__data[testament])
+            sections[testament] = dict(section, offset=offset, size=size)
+            blobs.append(self.__data[testament])
+            offset += size
+        header = json.dumps(sections).encode('utf-8')
+        # A temporary file of its own, as other processes may be saving the same index
+        tmp_fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(self.path) + '.', suffix='.tmp',
+                                            dir=os.path.dirname(os.path.abspath(self.path)))
+        try:
+            with open(tmp_fd, 'wb') as index_file:
+                index_file.write(self.file_magic + INDEX_FILE_VERSION.to_bytes(2, 'little') +
+                                 len(header).to_bytes(4, 'little') + header)
+                for blob in blobs:
+                    index_file.write(blob)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class SearchIndex(PostingIndex):
+    '''A positional full-text index of the verses of a module.'''
+
+    file_magic = b'PSWI'
+
+    def build_section(self, testament, fingerprint, verses):
+        '''(Re)build the section of testament from an iterable of (index, text) of its verses.'''
+        postings = {}
+        for index, text in verses:
+            positions = {}
+            for position, term in enumerate(tokenize(text)):
+                positions.setdefault(term, []).append(position)
+            for term, term_positions in positions.items():
+                postings.setdefault(term, []).append((index, term_positions))
+        posting_lists = {}
+        for term, term_postings in postings.items():
+            numbers = [len(term_postings)]
+            last_index = 0
+            for index, term_positions in term_postings:
+                numbers.extend((index - last_index, len(term_positions)))
+                last_index = index
+                last_position = 0
+                for position in term_positions:
+                    numbers.append(position - last_position)
+                    last_position = position
+            posting_lists[term] = numbers
+        self._store_section(testament, fingerprint, posting_lists)
+
+    def postings(self, testament, term):
+        '''Returns a dict of verse index -> list of positions of term in the testament.'''
+        numbers = self._posting_list(testament, term)
+        postings = {}
+        if not numbers:
+            return postings
+        pos = 1
+        index = 0
+        for i in range(numbers[0]):
+            index += numbers[pos]
+            count = numbers[pos+1]
+            pos += 2
+            positions = []
+            position = 0
+            for delta in numbers[pos:pos+count]:
+                position += delta
+                positions.append(position)
+            postings[index] = positions
+            pos += count
+        return postings
+
+    def __phrase(self, testament, terms):
+        '''Returns the set of verse indicies containing the terms as a phrase.'''
+        if not terms:
+            return set()
+        postings = [self.postings(testament, term) for term in terms]
+        indicies = set(postings[0])
+        for term_postings in postings[1:]:
+            indicies &= set(term_postings)
+        if len(terms) == 1:
+            return indicies
+        found = set()
+        for index in indicies:
+            following = [set(term_postings[index]) for term_postings in postings[1:]]
+            for position in postings[0][index]:
+                if all(position + i + 1 in positions for i, positions in enumerate(following)):
+                    found.add(index)
+                    break
+        return found
+
+    def search(self, query):
+        '''Returns a sorted list of (testament, index) of the verses matching query.'''
+        node = _QueryParser(query).parse()
+        results = []
+        for testament in self.testaments():
+            results.extend((testament, index) for index in sorted(self.__evaluate(testament, node)))
+        return results
+
+    def __evaluate(self, testament, node):
+        kind = node[0]
+        if kind == 'phrase':
+            return self.__phrase(testament, node[1])
+        if kind == 'or':
+            result = set()
+            for child in node[1]:
+                if child[0] == 'not':
+                    raise ValueError('NOT can only be combined with AND')
+                result |= self.__evaluate(testament, child)
+            return result
+        if kind == 'and':
+            positive = [child for child in node[1] if child[0] != 'not']
+            negative = [child[1] for child in node[1] if child[0] == 'not']
+            if not positive:
+                raise ValueError('A query needs at least one term that is not negated')
+            result = self.__evaluate(testament, positive[0])
+            for child in positive[1:]:
+                result &= self.__evaluate(testament, child)
+            for child in negative:
+                result -= self.__evaluate(testament, child)
+            return result
+        raise ValueError('A query needs at least one term that is not negated')
+
+
+class LemmaIndex(PostingIndex):
+    '''An index of the Strong's numbers, lemmas and morphology codes in the markup of a module.'''
+
+    file_magic = b'PSWL'
+
+    def build_section(self, testament, fingerprint, verses):
+        '''(Re)build the section of testament from an iterable of (index, text) of its verses.'''
+        postings = {}
+        for index, text in verses:
+            for lemma in extract_lemmas(text):
+                postings.setdefault(lemma, []).append(index)
+        posting_lists = {}
+        for lemma, indicies in postings.items():
+            posting_lists[lemma] = [index - last_index for index, last_index in zip(indicies, [0] + indicies)]
+        self._store_section(testament, fingerprint, posting_lists)
+
+    def search(self, lemma):
+        '''Returns a sorted list of (testament, index) of the verses tagged with lemma, eg. 'H430',
+        'strong:H0430' or 'robinson:N-NSM'.
+        '''
+        lemma = normalize_lemma(lemma)
+        results = []
+        for testament in self.testaments():
+            index = 0
+            for delta in self._posting_list(testament, lemma):
+                index += delta
+                results.append((testament, index))
+        return results
+
+
+class _QueryParser(object):
+    '''Parses a query into a tree of ('phrase', terms), ('not', node), ('and', nodes) and ('or', nodes).'''
+
+    def __init__(self, query):
+        self.__tokens = []
+        for match in _query_re.finditer(query):
+            phrase_minus, phrase, open_paren, close_paren, word_minus, word, quote = match.groups()
+            if quote:
+                raise ValueError('Unbalanced " in query')
+            if open_paren or close_paren:
+                self.__tokens.append(open_paren or close_paren)
+            elif word in ('AND', 'OR', 'NOT') and not word_minus:
+                self.__tokens.append(word)
+            else:
+                if phrase_minus or word_minus:
+                    self.__tokens.append('NOT')
+                terms = tokenize(phrase or word or '')
+                if not terms:
+                    raise ValueError('Empty phrase %s in query' % match.group())
+                self.__tokens.append(('phrase', terms))
+        self.__pos = 0
+
+    def __peek(self):
+        if self.__pos < len(self.__tokens):
+            return self.__tokens[self.__pos]
+        return None
+
+    def __next(self):
+        token = self.__peek()
+        self.__pos += 1
+        return token
+
+    def parse(self):
+        if not self.__tokens:
+            raise ValueError('Empty query')
+        node = self.__or()
+        if self.__peek() is not None:
+            raise ValueError('Unexpected %r in query' % (self.__peek(),))
+        return node
+
+    def __or(self):
+        nodes = [self.__and()]
+        while self.__peek() == 'OR':
+            self.__next()
+            nodes.append(self.__and())
+        return nodes[0] if len(nodes) == 1 else ('or', nodes)
+
+    def __and(self):
+        nodes = [self.__unary()]
+        while self.__peek() not in (None, 'OR', ')'):
+            if self.__peek() == 'AND':
+                self.__next()
+            nodes.append(self.__unary())
+        return nodes[0] if len(nodes) == 1 else ('and', nodes)
+
+    def __unary(self):
+        token = self.__next()
+        if token == 'NOT':
+            return ('not', self.__unary())
+        if token == '(':
+            node = self.__or()
+            if self.__next() != ')':
+                raise ValueError('Missing ) in query')
+            return node
+        if isinstance(token, tuple):
+            return token
+        raise ValueError('Unexpected %r in query' % (token,))
@@ -0,0 +1,107 @@
+###############################################################################
+# PySword - A native Python reader of the SWORD Project Bible Modules         #
+# --------------------------------------------------------------------------- #
+# Copyright (c) 2008-2015 Various developers:                                 #
+# Kenneth Arnold, Joshua Gross, Ryan Hiebert, Matthew Wardrop, Tomas Groth    #
+# --------------------------------------------------------------------------- #
+# This program is free software; you can redistribute it and/or modify it     #
+# under the terms of the GNU General Public License as published by the Free  #
+# Software Foundation; version 2 of the License.                              #
+#                                                                             #
+# This program is distributed in the hope that it will be useful, but WITHOUT #
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or       #
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for    #
+# more details.                                                               #
+#                                                                             #
+# You should have received a copy of the GNU General Public License along     #
+# with this program; if not, write to the Free Software Foundation, Inc., 59  #
+# Temple Place, Suite 330, Boston, MA 02111-1307 USA                          #
+###############################################################################
+
+# Generates small SWORD modules for the tests, in every module format.
+
+import os
+import struct
+import tempfile
+import zlib
+
+from pysword.canons import get_canon
+
+
+def default_text(book, chapter, verse):
+    return '%s %d:%d <w lemma="strong:H%04d">word</w> text<note>note</note>.' % (book, chapter, verse,
+                                                                                chapter * 7 + verse)
+
+
+def verse_indicies(versification='default'):
+    '''Returns a dict of testament -> (number of indicies, list of (index, book, chapter, verse)).'''
+    canon = get_canon(versification)
+    testaments = {}
+    for testament in ('ot', 'nt'):
+        idx = 2  # the testament heading
+        verses = []
+        for name, osis_name, preferred_abbreviation, chapter_lengths in canon[testament]:
+            idx += 1  # the book heading
+            for chapter, chapter_length in enumerate(chapter_lengths, 1):
+                idx += 1  # the chapter heading
+                for verse in range(1, chapter_length + 1):
+                    verses.append((idx, name, chapter, verse))
+                    idx += 1
+        testaments[testament] = (idx, verses)
+    return testaments
+
+
+def build_module(sword_path, module_type, name=None, text=default_text, versification='default',
+                 testaments=('ot', 'nt'), block_size=25):
+    '''Write a module to the SWORD folder sword_path, with text(book, chapter, verse) as the text of each
+    verse. Returns the module name.
+    '''
+    name = name or 'Test' + module_type.upper()
+    data_path = os.path.join('modules', 'texts', module_type, name.lower())
+    module_path = os.path.join(sword_path, data_path)
+    os.makedirs(module_path, exist_ok=True)
+    for testament, (size, verses) in verse_indicies(versification).items():
+        if testament not in testaments:
+            continue
+        texts = dict((idx, text(book, chapter, verse).encode('utf-8')) for idx, book, chapter, verse in verses)
+        if module_type in ('rawtext', 'rawtext4'):
+            record_format = '<IH' if module_type == 'rawtext' else '<II'
+            data = bytearray()
+            records = bytearray()
+            for idx in range(size):
+                verse_text = texts.get(idx, b'')
+                records += struct.pack(record_format, len(data), len(verse_text))
+                data += verse_text
+            files = {testament: data, testament + '.vss': records}
+        else:
+            record_format = '<IIH' if module_type == 'ztext' else '<III'
+            verse_records = bytearray()
+            block_records = bytearray()
+            compressed = bytearray()
+            block = bytearray()
+            for idx in range(size):
+                verse_text = texts.get(idx, b'')
+                verse_records += struct.pack(record_format, len(block_records) // 12, len(block), len(verse_text))
+                block += verse_text
+                if (idx + 1) % block_size == 0 or idx + 1 == size:
+                    compressed_block = zlib.compress(bytes(block))
+                    block_records += struct.pack('<III', len(compressed), len(compressed_block), len(block))
+                    compressed += compressed_block
+                    block = bytearray()
+            files = {testament + '.bzv': verse_records, testament + '.bzs': block_records,
+                     testament + '.bzz': compressed}
+        for file_name, data in files.items():
+            with open(os.path.join(module_path, file_name), 'wb') as f:
+                f.write(data)
+    os.makedirs(os.path.join(sword_path, 'mods.d'), exist_ok=True)
+    with open(os.path.join(sword_path, 'mods.d', name.lower() + '.conf'), 'wt') as conf:
+        conf.write('[%s]\nDataPath=./%s/\nModDrv=%s\nEncoding=UTF-8\nDescription=Test module %s\n'
+                   % (name, data_path.replace(os.sep, '/'), module_type.capitalize(), name))
+        if versification != 'default':
+            conf.write('Versification=%s\n' % versification)
+    return name
+
+
+def sword_folder():
+    '''Returns a temporary SWORD folder, removed when the returned object is cleaned up.'''
+    return tempfile.TemporaryDirectory(prefix='pysword-test-')
@@ -0,0 +1,118 @@
+###############################################################################
+# PySword - A native Python reader of the SWORD Project Bible Modules         #
+# --------------------------------------------------------------------------- #
+# Copyright (c) 2008-2015 Various developers:                                 #
+# Kenneth Arnold, Joshua Gross, Ryan Hiebert, Matthew Wardrop, Tomas Groth    #
+# --------------------------------------------------------------------------- #
+# This program is free software; you can redistribute it and/or modify it     #
+# under the terms of the GNU General Public License as published by the Free  #
+# Software Foundation; version 2 of the License.                              #
+#                                                                             #
+# This program is distributed in the hope that it will be useful, but WITHOUT #
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or       #
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for    #
+# more details.                                                               #
+#                                                                             #
+# You should have received a copy of the GNU General Public License along     #
+# with this program; if not, write to the Free Software Foundation, Inc., 59  #
+# Temple Place, Suite 330, Boston, MA 02111-1307 USA                          #
+###############################################################################
+
+import asyncio
+import os
+import threading
+import unittest
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+
+from pysword.bible import SwordBible, Verse
+
+from .fixtures import build_module, default_text, sword_folder
+
+
+class TestSwordBible(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.folder = sword_folder()
+        cls.module_paths = {}
+        for module_type in ('ztext', 'ztext4', 'rawtext', 'rawtext4'):
+            build_module(cls.folder.name, module_type)
+            cls.module_paths[module_type] = os.path.join(cls.folder.name, 'modules', 'texts', module_type,
+                                                         'test' + module_type)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.folder.cleanup()
+
+    def bibles(self, **kwargs):
+        for module_type, module_path in self.module_paths.items():
+            with SwordBible(module_path, module_type, encoding='utf-8', **kwargs) as bible:
+                yield bible
+
+    def test_get(self):
+        for bible in self.bibles():
+            self.assertEqual(bible.get('john', 3, 16), default_text('John', 3, 16))
+            self.assertEqual(bible.get('gen', 1, [1, 2], join='|'),
+                             default_text('Genesis', 1, 1) + '|' + default_text('Genesis', 1, 2))
+            self.assertEqual(len(list(bible.getiter())), 31102)
+
+    def test_options(self):
+        expected = list(SwordBible(self.module_paths['ztext'], encoding='utf-8').getiter(['gen', 'rev']))
+        options = [{'use_mmap': True}, {'preload': True}, {'decompress_workers': 2}, {'readahead': 3},
+                   {'block_cache_size': 0}]
+        for kwargs in options:
+            for bible in self.bibles(**kwargs):
+                self.assertEqual(list(bible.getiter(['gen', 'rev'])), expected)
+
+    def test_shared_between_threads(self):
+        expected = SwordBible(self.module_paths['ztext'], encoding='utf-8').get(['gen', 'ps'])
+        with SwordBible(self.module_paths['ztext'], encoding='utf-8', decompress_workers=2) as bible:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                texts = list(executor.map(lambda books: bible.get(books), [['gen', 'ps']] * 16))
+        self.assertEqual(texts, [expected] * 16)
+
+    def test_shared_executor(self):
+        bibles = [SwordBible(self.module_paths['ztext'], encoding='utf-8', decompress_workers=4) for i in range(20)]
+        for bible in bibles:
+            bible.get('gen')
+        threads = [thread for thread in threading.enumerate() if thread.name.startswith('pysword-decompress')]
+        self.assertLessEqual(len(threads), os.cpu_count() or 1)
+        for bible in bibles:
+            bible.close()
+
+    def test_readahead(self):
+        for kwargs, submits in (({'decompress_workers': 2, 'readahead': 0}, 0), ({'readahead': 2}, 1),
+                                ({'decompress_workers': 2}, 1)):
+            executor = ThreadPoolExecutor(max_workers=1)
+            with mock.patch.object(executor, 'submit', wraps=executor.submit) as submit:
+                with SwordBible(self.module_paths['ztext'], encoding='utf-8', executor=executor, **kwargs) as bible:
+                    bible.get('gen', 1)
+                self.assertEqual(bool(submit.call_count), bool(submits))
+            executor.shutdown()
+
+    def test_encoding(self):
+        # A known encoding is used as is, chardet only detects unknown or missing ones, eg. SCSU
+        import chardet
+        with sword_folder() as path:
+            build_module(path, 'ztext', text=lambda book, chapter, verse: 'Genèse %s %d:%d' % (book, chapter, verse))
+            module_path = os.path.join(path, 'modules', 'texts', 'ztext', 'testztext')
+            for encoding, detected in (('utf-8', False), ('UTF-8', False), ('SCSU', True), (None, True)):
+                with mock.patch.object(chardet, 'detect', wraps=chardet.detect) as detect:
+                    with SwordBible(module_path, encoding=encoding) as bible:
+                        self.assertEqual(bible.get('gen', 1, 1), 'Genèse Genesis 1:1')
+                    self.assertEqual(detect.called, detected)
+
+    def test_getiter_verses(self):
+        for bible in self.bibles():
+            self.assertEqual(list(bible.getiter_verses('john', 3, [16])),
+                             [Verse('John', 3, 16, default_text('John', 3, 16))])
+
+    def test_aget(self):
+        for bible in self.bibles():
+            expected = bible.get(['gen', 'matt'], filter_mode='plain')
+            self.assertEqual(asyncio.run(bible.aget(['gen', 'matt'], chunk_size=7, filter_mode='plain')), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
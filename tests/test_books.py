@@ -0,0 +1,134 @@
+###############################################################################
+# PySword - A native Python reader of the SWORD Project Bible Modules         #
+# --------------------------------------------------------------------------- #
+# Copyright (c) 2008-2015 Various developers:                                 #
+# Kenneth Arnold, Joshua Gross, Ryan Hiebert, Matthew Wardrop, Tomas Groth    #
+# --------------------------------------------------------------------------- #
+# This program is free software; you can redistribute it and/or modify it     #
+# under the terms of the GNU General Public License as published by the Free  #
+# Software Foundation; version 2 of the License.                              #
+#                                                                             #
+# This program is distributed in the hope that it will be useful, but WITHOUT #
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or       #
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for    #
+# more details.                                                               #
+#                                                                             #
+# You should have received a copy of the GNU General Public License along     #
+# with this program; if not, write to the Free Software Foundation, Inc., 59  #
+# Temple Place, Suite 330, Boston, MA 02111-1307 USA                          #
+###############################################################################
+
+import os
+import threading
+import unittest
+from unittest import mock
+
+from pysword.bible import SwordBible
+from pysword.books import BibleStructure, BookStructure, get_structure
+
+from .fixtures import build_module, sword_folder, verse_indicies
+
+
+class TestIndicies(unittest.TestCase):
+
+    def test_book_offsets(self):
+        book = BookStructure('Test', 'Test', 'Tst', [3, 1, 2])
+        self.assertEqual(book.size, 10)
+        self.assertEqual([book.chapter_offset(chapter) for chapter in range(4)], [2, 6, 8, 11])
+        self.assertEqual(book.get_indicies(), [2, 3, 4, 6, 8, 9])
+        self.assertEqual(book.get_indicies(chapters=3, verses=2, offset=100), [109])
+
+    def test_indicies(self):
+        for versification in ('default', 'kjva', 'catholic', 'synodal'):
+            structure = BibleStructure(versification)
+            for testament, (size, verses) in verse_indicies(versification).items():
+                verse_at = dict((index, (book, chapter, verse)) for index, book, chapter, verse in verses)
+                for index, book, chapter, verse in verses:
+                    self.assertEqual(structure.ref_to_index(book, chapter, verse), (testament, index))
+                # Headings are not verses
+                for index in range(size + 1):
+                    self.assertEqual(structure.index_to_reference(testament, index), verse_at.get(index))
+                indicies, references = structure.ref_to_indicies_and_references()[testament]
+                self.assertEqual(indicies, [verse[0] for verse in verses])
+                self.assertEqual(references, [verse[1:] for verse in verses])
+
+    def test_ref_to_indicies(self):
+        structure = BibleStructure('default')
+        self.assertEqual(structure.ref_to_indicies('gen', 1, [1, 2]), {'ot': [4, 5]})
+        self.assertEqual(structure.ref_to_indicies(['gen', 'matt'], 1, 1), {'ot': [4], 'nt': [4]})
+        self.assertEqual(structure.ref_to_indicies('gen', [1, 2], 5), structure.ref_to_indicies('gen', [1, 2]))
+
+
+
+class TestFindBook(unittest.TestCase):
+
+    def test_names(self):
+        structure = BibleStructure('default')
+        for name in ('John', 'john', 'JOHN', 'jOhN'):
+            testament, book = structure.find_book(name)
+            self.assertEqual((testament, book.name), ('nt', 'John'))
+        self.assertIs(structure.find_book('I Samuel')[1], structure.find_book('1sam')[1])
+        self.assertRaises(ValueError, structure.find_book, 'Jo')
+        self.assertRaises(ValueError, structure.find_book, 'nosuchbook')
+
+    def test_first_name_wins(self):
+        # Like searching the books in order, the first book with a name is found
+        canon = {'ot': [('First', 'Same', 'Fst', [1]), ('Second', 'Same', 'Snd', [1])],
+                 'nt': [('Third', 'Thd', 'second', [1])]}
+        with mock.patch('pysword.books.get_canon', return_value=canon):
+            structure = BibleStructure('test')
+        self.assertEqual(structure.find_book('same')[1].name, 'First')
+        self.assertEqual(structure.find_book('Second'), ('ot', structure.find_book('snd')[1]))
+        self.assertEqual(structure.find_book('thd')[0], 'nt')
+
+    def test_add_alias(self):
+        structure = BibleStructure('default')
+        structure.add_alias('Evangelium Ioannis', 'JOHN')
+        self.assertIs(structure.find_book('evangelium ioannis'), structure.find_book('John'))
+        self.assertEqual(structure.ref_to_index('Evangelium Ioannis', 3, 16), structure.ref_to_index('John', 3, 16))
+        self.assertRaises(ValueError, structure.add_alias, 'Alias', 'nosuchbook')
+        self.assertRaises(ValueError, structure.find_book, 'Alias')
+        # Aliases only apply to their own structure
+        self.assertRaises(ValueError, BibleStructure('default').find_book, 'Evangelium Ioannis')
+
+
+
+class TestGetStructure(unittest.TestCase):
+
+    def test_shared(self):
+        structure = get_structure('kjva')
+        self.assertIsInstance(structure, BibleStructure)
+        self.assertIs(get_structure('kjva'), structure)
+        self.assertIsNot(get_structure('default'), structure)
+
+    def test_bibles_share(self):
+        with sword_folder() as path:
+            bibles = []
+            for module_type in ('ztext', 'rawtext'):
+                build_module(path, module_type)
+                bibles.append(SwordBible(os.path.join(path, 'modules', 'texts', module_type, 'test' + module_type),
+                                         module_type, encoding='utf-8'))
+            self.assertIs(bibles[0].structure, get_structure('default'))
+            self.assertIs(bibles[1].structure, bibles[0].structure)
+            for bible in bibles:
+                bible.close()
+
+    def test_threads(self):
+        # Threads asking for a versification at the same time get the same structure
+        structures = []
+        barrier = threading.Barrier(8)
+
+        def get():
+            barrier.wait()
+            structures.append(get_structure('synodal'))
+        threads = [threading.Thread(target=get) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(structures), 8)
+        self.assertEqual(len(set(map(id, structures))), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
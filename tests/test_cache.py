@@ -0,0 +1,144 @@
+###############################################################################
+# PySword - A native Python reader of the SWORD Project Bible Modules         #
+# --------------------------------------------------------------------------- #
+# Copyright (c) 2008-2015 Various developers:                                 #
+# Kenneth Arnold, Joshua Gross, Ryan Hiebert, Matthew Wardrop, Tomas Groth    #
+# --------------------------------------------------------------------------- #
+# This program is free software; you can redistribute it and/or modify it     #
+# under the terms of the GNU General Public License as published by the Free  #
+# Software Foundation; version 2 of the License.                              #
+#                                                                             #
+# This program is distributed in the hope that it will be useful, but WITHOUT #
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or       #
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for    #
+# more details.                                                               #
+#                                                                             #
+# You should have received a copy of the GNU General Public License along     #
+# with this program; if not, write to the Free Software Foundation, Inc., 59  #
+# Temple Place, Suite 330, Boston, MA 02111-1307 USA                          #
+###############################################################################
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+from pysword.bible import SwordBible
+from pysword.cache import CachedText, LRUCache
+from pysword.files import FileReader
+
+from .fixtures import build_module, sword_folder
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_eviction_by_entries(self):
+        cache = LRUCache(max_entries=2)
+        cache.put('a', b'1')
+        cache.put('b', b'2')
+        cache.get('a')
+        cache.put('c', b'3')
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.stats(), {'entries': 2, 'bytes': 2, 'hits': 1, 'misses': 0, 'evictions': 1})
+
+    def test_eviction_by_bytes(self):
+        cache = LRUCache(max_bytes=10)
+        cache.put('a', b'123456')
+        cache.put('b', b'123456')
+        self.assertEqual((len(cache), cache.size), (1, 6))
+        cache.put('c', b'12345678901')
+        self.assertNotIn('c', cache)
+
+    def test_disabled(self):
+        cache = LRUCache(max_entries=0)
+        cache.put('a', b'1')
+        self.assertIsNone(cache.get('a'))
+
+    def test_purge(self):
+        cache = LRUCache()
+        for key in range(10):
+            cache.put(key, b'12')
+        self.assertEqual(cache.purge(lambda key: key % 2), 5)
+        self.assertEqual((len(cache), cache.size), (5, 10))
+
+    def test_cached_text_size(self):
+        self.assertEqual(len(CachedText('text', None)), sys.getsizeof('text'))
+
+
+class TestTextCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.folder = sword_folder()
+        build_module(cls.folder.name, 'ztext')
+        build_module(cls.folder.name, 'rawtext')
+        cls.rawtext_path = os.path.join(cls.folder.name, 'modules', 'texts', 'rawtext', 'testrawtext')
+        cls.module_path = os.path.join(cls.folder.name, 'modules', 'texts', 'ztext', 'testztext')
+        cls.bible = SwordBible(cls.module_path, encoding='utf-8')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.bible.close()
+        cls.folder.cleanup()
+
+    def test_same_text(self):
+        cache = LRUCache(max_bytes=1024 * 1024)
+        with SwordBible(self.module_path, encoding='utf-8', text_cache=cache) as bible:
+            for filter_mode in (None, 'plain', 'strongs', 'footnotes'):
+                for reference in (('john', 3, [16, 18, 17]), ('john', 3), (['gen', 'john'], 1)):
+                    expected = self.bible.get(*reference, filter_mode=filter_mode)
+                    self.assertEqual(bible.get(*reference, filter_mode=filter_mode), expected)
+                    self.assertEqual(bible.get(*reference, filter_mode=filter_mode), expected)
+            self.assertGreater(cache.hits, 0)
+
+    def test_memory_budget(self):
+        cache = LRUCache(max_bytes=10000)
+        with SwordBible(self.module_path, encoding='utf-8', text_cache=cache) as bible:
+            bible.get('gen', filter_mode='plain')
+            self.assertLessEqual(cache.size, 10000)
+            self.assertLess(len(cache), 10000 // sys.getsizeof(''))
+            self.assertGreater(cache.evictions, 0)
+
+    def test_partly_warm_cache(self):
+        reads = []
+        read = FileReader.read
+
+        def counting_read(reader, offset, size):
+            reads.append(size)
+            return read(reader, offset, size)
+        for filter_mode in (None, 'plain'):
+            with mock.patch.object(FileReader, 'read', counting_read):
+                with SwordBible(self.rawtext_path, 'rawtext', encoding='utf-8') as bible:
+                    expected = list(bible.getiter(['gen', 'exod'], filter_mode=filter_mode))
+                uncached_size = sum(reads)
+                with SwordBible(self.rawtext_path, 'rawtext', encoding='utf-8', text_cache=LRUCache()) as bible:
+                    for chapter in range(1, 51, 2):
+                        bible.get('gen', chapter, filter_mode=filter_mode)
+                    del reads[:]
+                    self.assertEqual(list(bible.getiter(['gen', 'exod'], filter_mode=filter_mode)), expected)
+            self.assertLess(sum(reads), uncached_size)
+            del reads[:]
+
+    def test_verse_of_cached_chapter(self):
+        for filter_mode in (None, 'plain'):
+            cache = LRUCache()
+            with SwordBible(self.module_path, encoding='utf-8', text_cache=cache) as bible:
+                bible.get('john', 3, filter_mode=filter_mode)
+                self.assertEqual(bible.get('john', 3, 16, filter_mode=filter_mode),
+                                 self.bible.get('john', 3, 16, filter_mode=filter_mode))
+            self.assertEqual(cache.hits, 1)
+
+    def test_close_removes_entries(self):
+        cache = LRUCache()
+        other = SwordBible(self.module_path, encoding='utf-8', text_cache=cache)
+        with SwordBible(self.module_path, encoding='utf-8', text_cache=cache) as bible:
+            bible.get('john', 3)
+            other.get('john', 3)
+            self.assertEqual(len(cache), 72)
+        self.assertEqual(len(cache), 36)
+        other.close()
+        self.assertEqual((len(cache), cache.size), (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
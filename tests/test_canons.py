@@ -0,0 +1,82 @@
+###############################################################################
+# PySword - A native Python reader of the SWORD Project Bible Modules         #
+# --------------------------------------------------------------------------- #
+# Copyright (c) 2008-2015 Various developers:                                 #
+# Kenneth Arnold, Joshua Gross, Ryan Hiebert, Matthew Wardrop, Tomas Groth    #
+# --------------------------------------------------------------------------- #
+# This program is free software; you can redistribute it and/or modify it     #
+# under the terms of the GNU General Public License as published by the Free  #
+# Software Foundation; version 2 of the License.                              #
+#                                                                             #
+# This program is distributed in the hope that it will be useful, but WITHOUT #
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or       #
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for    #
+# more details.                                                               #
+#                                                                             #
+# You should have received a copy of the GNU General Public License along     #
+# with this program; if not, write to the Free Software Foundation, Inc., 59  #
+# Temple Place, Suite 330, Boston, MA 02111-1307 USA                          #
+###############################################################################
+
+import os
+import tempfile
+import unittest
+
+from pysword import canons
+from pysword.books import BibleStructure
+from pysword.canons import get_canon, load_canon_file, pack_canon, unpack_canon, validate_canon
+
+
+class TestCanons(unittest.TestCase):
+
+    def test_lazy_attributes(self):
+        self.assertIs(canons.kjva, get_canon('kjva'))
+        self.assertRaises(AttributeError, getattr, canons, 'nosuchcanon')
+
+    def test_unknown_versification(self):
+        self.assertIs(get_canon('nosuchversification'), get_canon('default'))
+
+    def test_catholic(self):
+        self.assertIs(get_canon('catholic'), canons.canon_catholic.catholic)
+        self.assertIsNot(get_canon('catholic'), get_canon('default'))
+        structure = BibleStructure('catholic')
+        self.assertEqual(structure.find_book('tob')[1].name, 'Tobit')
+        self.assertNotEqual(structure.ref_to_index('ps', 119, 1), BibleStructure('default').ref_to_index('ps', 119, 1))
+
+    def test_round_trip(self):
+        for versification in canons.versifications:
+            canon = get_canon(versification)
+            name, unpacked = unpack_canon(pack_canon(versification, canon))
+            self.assertEqual(name, versification)
+            for testament in ('ot', 'nt'):
+                self.assertEqual([(book[0], book[1], book[2], list(book[3])) for book in canon[testament]],
+                                 unpacked[testament])
+            validate_canon(versification, unpacked)
+
+    def test_validate(self):
+        name, canon = unpack_canon(pack_canon('default', get_canon('default')))
+        canon['nt'][0] = canon['nt'][0][:3] + ([1, 2, 3],)
+        self.assertRaises(ValueError, validate_canon, 'default', canon)
+        self.assertRaises(ValueError, validate_canon, 'default', {'ot': canon['ot'][1:], 'nt': canon['nt']})
+        # Canons of unknown versifications cannot be validated
+        validate_canon('custom', canon)
+
+    def test_corrupt(self):
+        data = pack_canon('default', get_canon('default'))
+        for size in range(0, len(data), 7):
+            self.assertRaises(ValueError, unpack_canon, data[:size])
+        self.assertRaises(ValueError, unpack_canon, data + b'\x01\x00')
+        self.assertRaises(ValueError, unpack_canon, b'XXXX' + data[4:])
+
+    def test_load_canon_file(self):
+        canon = {'ot': [('First', 'Fir', 'Fi', [3, 2])], 'nt': [('Second', 'Sec', 'Se', [4])]}
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'test.canon')
+            with open(path, 'wb') as canon_file:
+                canon_file.write(pack_canon('testcanon', canon))
+            self.assertEqual(load_canon_file(path), 'testcanon')
+        self.assertEqual(get_canon('testcanon'), canon)
+
+
+if __name__ == '__main__':
+    unittest.main()
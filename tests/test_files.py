@@ -0,0 +1,111 @@
+###############################################################################
+# PySword - A native Python reader of the SWORD Project Bible Modules         #
+# --------------------------------------------------------------------------- #
+# Copyright (c) 2008-2015 Various developers:                                 #
+# Kenneth Arnold, Joshua Gross, Ryan Hiebert, Matthew Wardrop, Tomas Groth    #
+# --------------------------------------------------------------------------- #
+# This program is free software; you can redistribute it and/or modify it     #
+# under the terms of the GNU General Public License as published by the Free  #
+# Software Foundation; version 2 of the License.                              #
+#                                                                             #
+# This program is distributed in the hope that it will be useful, but WITHOUT #
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or       #
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for    #
+# more details.                                                               #
+#                                                                             #
+# You should have received a copy of the GNU General Public License along     #
+# with this program; if not, write to the Free Software Foundation, Inc., 59  #
+# Temple Place, Suite 330, Boston, MA 02111-1307 USA                          #
+###############################################################################
+
+import gc
+import os
+import tempfile
+import unittest
+
+from pysword.bible import SwordBible
+from pysword.files import FilePool, FileReader
+
+from .fixtures import build_module
+
+
+class TestFilePool(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.paths = []
+        for i in range(4):
+            path = os.path.join(self.folder.name, 'file%d' % i)
+            with open(path, 'wb') as f:
+                f.write(b'file%d data' % i)
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_lazy(self):
+        pool = FilePool()
+        reader = FileReader(self.paths[0], pool=pool)
+        self.assertEqual(len(pool), 0)
+        self.assertEqual(reader.read(6, 4), b'data')
+        self.assertEqual(len(pool), 1)
+        reader.close()
+        self.assertEqual(len(pool), 0)
+        self.assertRaises(ValueError, reader.read, 0, 4)
+
+    def test_max_open(self):
+        pool = FilePool(max_open=2)
+        readers = [FileReader(path, pool=pool) for path in self.paths]
+        for i, reader in enumerate(readers):
+            self.assertEqual(reader.read(0, 5), b'file%d' % i)
+            self.assertLessEqual(len(pool), 2)
+        # The least recently used file is closed, and reopened when it is read again
+        first = pool.acquire(readers[0])
+        self.assertEqual(len(pool), 2)
+        self.assertEqual(readers[1].read(0, 5), b'file1')
+        self.assertFalse(first.closed)
+        self.assertEqual(readers[2].read(0, 5), b'file2')
+        self.assertFalse(first.closed)
+        pool.release(readers[0])
+        self.assertEqual(readers[3].read(0, 5), b'file3')
+        self.assertTrue(first.closed)
+        self.assertEqual(readers[0].read(0, 5), b'file0')
+
+    def test_in_use(self):
+        # Files being read from are not closed, even if that means going over max_open
+        pool = FilePool(max_open=1)
+        readers = [FileReader(path, pool=pool) for path in self.paths[:2]]
+        files = [pool.acquire(reader) for reader in readers]
+        self.assertEqual(len(pool), 2)
+        self.assertFalse(any(f.closed for f in files))
+        for reader in readers:
+            pool.release(reader)
+        reader = FileReader(self.paths[2], pool=pool)
+        self.assertEqual(reader.read(0, 5), b'file2')
+        self.assertEqual(len(pool), 1)
+        self.assertTrue(all(f.closed for f in files))
+
+
+    def test_garbage_collected(self):
+        # The files of readers that are dropped without being closed are closed
+        pool = FilePool()
+        reader = FileReader(self.paths[0], pool=pool)
+        f = pool.acquire(reader)
+        pool.release(reader)
+        del reader
+        gc.collect()
+        self.assertEqual(len(pool), 0)
+        self.assertTrue(f.closed)
+        for module_type in ('ztext', 'rawtext'):
+            build_module(self.folder.name, module_type)
+            bible = SwordBible(os.path.join(self.folder.name, 'modules', 'texts', module_type, 'test' + module_type),
+                               module_type, encoding='utf-8', file_pool=pool)
+            bible.get('john', 3, 16)
+            self.assertGreater(len(pool), 0)
+            del bible
+            gc.collect()
+            self.assertEqual(len(pool), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
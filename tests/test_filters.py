@@ -0,0 +1,138 @@
+###############################################################################
+# PySword - A native Python reader of the SWORD Project Bible Modules         #
+# --------------------------------------------------------------------------- #
+# Copyright (c) 2008-2015 Various developers:                                 #
+# Kenneth Arnold, Joshua Gross, Ryan Hiebert, Matthew Wardrop, Tomas Groth    #
+# --------------------------------------------------------------------------- #
+# This program is free software; you can redistribute it and/or modify it     #
+# under the terms of the GNU General Public License as published by the Free  #
+# Software Foundation; version 2 of the License.                              #
+#                                                                             #
+# This program is distributed in the hope that it will be useful, but WITHOUT #
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or       #
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for    #
+# more details.                                                               #
+#                                                                             #
+# You should have received a copy of the GNU General Public License along     #
+# with this program; if not, write to the Free Software Foundation, Inc., 59  #
+# Temple Place, Suite 330, Boston, MA 02111-1307 USA                          #
+###############################################################################
+
+import unittest
+
+from pysword.bible import SwordBible
+from pysword.filters import MarkupFilter, MarkupFilterMode
+
+from .fixtures import build_module, sword_folder
+
+
+def feed_all(markup_filter, verses):
+    return [markup_filter.feed(verse, final=num == len(verses)) for num, verse in enumerate(verses, 1)]
+
+
+class TestMarkupFilter(unittest.TestCase):
+
+    def test_plain(self):
+        markup_filter = MarkupFilter(MarkupFilterMode.PLAIN)
+        self.assertEqual(markup_filter.feed(b'In <w lemma="strong:H7225">the beginning</w><note>A note</note>.'),
+                         b'In the beginning.')
+
+    def test_strongs(self):
+        markup_filter = MarkupFilter(MarkupFilterMode.STRONGS)
+        self.assertEqual(markup_filter.feed(b'<w lemma="strong:H0430 lemma.TR:x">God</w> said'),
+                         b'God [H430] said')
+        self.assertEqual(markup_filter.feed(b'God<WH430> said'), b'God [H430] said')
+
+    def test_footnotes(self):
+        markup_filter = MarkupFilter(MarkupFilterMode.FOOTNOTES)
+        self.assertEqual(markup_filter.feed(b'word<note>a note</note>.'), b'word [a note].')
+        self.assertEqual(markup_filter.feed(b'word<RF>gbf note<Rf>.'), b'word [gbf note].')
+
+    def test_entities(self):
+        markup_filter = MarkupFilter(MarkupFilterMode.PLAIN)
+        self.assertEqual(markup_filter.feed(b'a &amp; b &#233; &#xE9; &bogus;'),
+                         'a & b \xe9 \xe9 &bogus;'.encode('utf-8'))
+
+    def test_invalid_mode(self):
+        self.assertRaises(ValueError, MarkupFilter, 'html')
+
+    def test_tag_split_across_verses(self):
+        markup_filter = MarkupFilter(MarkupFilterMode.STRONGS)
+        self.assertEqual(feed_all(markup_filter, [b'a <w lem', b'ma="H2">b</w> c']), [b'a ', b'b [H2] c'])
+
+    def test_entity_split_across_verses(self):
+        markup_filter = MarkupFilter(MarkupFilterMode.PLAIN)
+        self.assertEqual(feed_all(markup_filter, [b'a &am', b'p; b']), [b'a ', b'& b'])
+
+    def test_note_across_verses(self):
+        markup_filter = MarkupFilter(MarkupFilterMode.PLAIN)
+        self.assertEqual(feed_all(markup_filter, [b'a<note>x', b'y</note>b']), [b'a', b'b'])
+
+    def test_less_than_in_text(self):
+        markup_filter = MarkupFilter(MarkupFilterMode.PLAIN)
+        self.assertEqual(feed_all(markup_filter, [b'5 < 6 is true', b'next']), [b'5 < 6 is true', b'next'])
+
+    def test_incomplete_tag_at_end(self):
+        markup_filter = MarkupFilter(MarkupFilterMode.PLAIN)
+        self.assertEqual(feed_all(markup_filter, [b'a <b', b'c']), [b'a ', b'<bc'])
+        self.assertEqual(markup_filter.state, MarkupFilter().state)
+
+    def test_long_incomplete_tag(self):
+        markup_filter = MarkupFilter(MarkupFilterMode.PLAIN)
+        verses = [b'a<b' + b'c' * 5000] + [b'd'] * 3
+        self.assertEqual(b''.join(feed_all(markup_filter, verses)), b''.join(verses))
+
+    def test_unclosed_note(self):
+        markup_filter = MarkupFilter(MarkupFilterMode.PLAIN)
+        output = feed_all(markup_filter, [b'a<note>b'] + [b'c'] * 10)
+        self.assertEqual(output[0], b'a')
+        self.assertEqual(output[-1], b'c')
+
+    def test_flush(self):
+        markup_filter = MarkupFilter(MarkupFilterMode.PLAIN)
+        self.assertEqual(markup_filter.feed(b'a &amp'), b'a ')
+        self.assertEqual(markup_filter.flush(), b'&amp')
+        self.assertEqual(markup_filter.state, MarkupFilter().state)
+        markup_filter.feed(b'a<note>b <x')
+        self.assertEqual(markup_filter.flush(), b'')
+
+    def test_final_resets(self):
+        markup_filter = MarkupFilter(MarkupFilterMode.PLAIN)
+        self.assertEqual(markup_filter.feed(b'a<note>b', final=True), b'a')
+        self.assertEqual(markup_filter.feed(b'c'), b'c')
+
+
+class TestBibleFilter(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.folder = sword_folder()
+
+        def text(book, chapter, verse):
+            if (book, chapter, verse) == ('Genesis', 1, 1):
+                return 'broken <note>never closed'
+            return '%d:%d <w lemma="strong:H%d">word</w>' % (chapter, verse, verse)
+        build_module(cls.folder.name, 'ztext', text=text)
+        cls.bible = SwordBible(cls.folder.name + '/modules/texts/ztext/testztext', encoding='utf-8')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.bible.close()
+        cls.folder.cleanup()
+
+    def test_modes(self):
+        self.assertEqual(self.bible.get('john', 3, 16, filter_mode='plain'), '3:16 word')
+        self.assertEqual(self.bible.get('john', 3, 16, filter_mode='strongs'), '3:16 word [H16]')
+
+    def test_reset_between_passages(self):
+        texts = list(self.bible.getiter('gen', 1, [1, 3], filter_mode='plain'))
+        self.assertEqual(texts, ['broken ', '1:3 word'])
+
+    def test_unclosed_note_in_passage(self):
+        texts = list(self.bible.getiter('gen', 1, filter_mode='plain'))
+        self.assertEqual(texts[0], 'broken ')
+        self.assertEqual(texts[-1], '1:31 word')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+###############################################################################
+# PySword - A native Python reader of the SWORD Project Bible Modules         #
+# --------------------------------------------------------------------------- #
+# Copyright (c) 2008-2015 Various developers:                                 #
+# Kenneth Arnold, Joshua Gross, Ryan Hiebert, Matthew Wardrop, Tomas Groth    #
+# --------------------------------------------------------------------------- #
+# This program is free software; you can redistribute it and/or modify it     #
+# under the terms of the GNU General Public License as published by the Free  #
+# Software Foundation; version 2 of the License.                              #
+#                                                                             #
+# This program is distributed in the hope that it will be useful, but WITHOUT #
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or       #
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for    #
+# more details.                                                               #
+#                                                                             #
+# You should have received a copy of the GNU General Public License along     #
+# with this program; if not, write to the Free Software Foundation, Inc., 59  #
+# Temple Place, Suite 330, Boston, MA 02111-1307 USA                          #
+###############################################################################
+
+import contextlib
+import io
+import json
+import os
+import threading
+import unittest
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from pysword.modules import ParallelVerse, SwordModules
+
+from .fixtures import build_module, default_text, sword_folder
+
+
+def text(book, chapter, verse):
+    return '%s %d:%d' % (book, chapter, verse)
+
+
+def kjva_text(book, chapter, verse):
+    return 'KJVA %s %d:%d' % (book, chapter, verse)
+
+
+class TestSwordModules(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.folder = sword_folder()
+        for module_type in ('ztext', 'ztext4', 'rawtext', 'rawtext4'):
+            build_module(cls.folder.name, module_type)
+        cls.zip_path = os.path.join(cls.folder.name, 'modules.zip')
+        with zipfile.ZipFile(cls.zip_path, 'w') as zip_file:
+            for directory, _, files in os.walk(cls.folder.name):
+                for file_name in files:
+                    path = os.path.join(directory, file_name)
+                    if path != cls.zip_path:
+                        # Store rawtext modules, so they are read in place
+                        compress_type = zipfile.ZIP_STORED if 'rawtext' in path else zipfile.ZIP_DEFLATED
+                        zip_file.write(path, os.path.relpath(path, cls.folder.name), compress_type)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.folder.cleanup()
+
+    def check_modules(self, path, **kwargs):
+        modules = SwordModules(path, **kwargs)
+        found = modules.parse_modules()
+        self.assertEqual(sorted(found), ['TestRAWTEXT', 'TestRAWTEXT4', 'TestZTEXT', 'TestZTEXT4'])
+        # The encoding comes from the config files, it is not detected
+        with mock.patch('chardet.detect') as detect:
+            for module_key in found:
+                with modules.get_bible_from_module(module_key) as bible:
+                    self.assertEqual(bible.get('john', 3, 16), default_text('John', 3, 16))
+                    self.assertEqual(len(list(bible.getiter('ps'))), 2461)
+            self.assertFalse(detect.called)
+        modules.close()
+
+    def test_folder(self):
+        self.check_modules(self.folder.name)
+
+    def test_zip(self):
+        self.check_modules(self.zip_path)
+
+    def test_catalog(self):
+        catalog_path = os.path.join(self.folder.name, 'catalog.json')
+        self.check_modules(self.folder.name, catalog_path=catalog_path)
+        self.assertTrue(os.path.exists(catalog_path))
+        self.check_modules(self.folder.name, catalog_path=catalog_path)
+
+    def test_corrupt_catalog(self):
+        catalog_path = os.path.join(self.folder.name, 'corrupt.json')
+        for contents in ('', '[]', '{"path": 1}', json.dumps({'path': os.path.abspath(self.folder.name)}),
+                         json.dumps({'path': os.path.abspath(self.folder.name), 'confs': []}),
+                         json.dumps({'path': os.path.abspath(self.folder.name), 'confs': {'a.conf': 1}})):
+            with open(catalog_path, 'wt') as catalog_file:
+                catalog_file.write(contents)
+            self.check_modules(self.folder.name, catalog_path=catalog_path)
+
+    def test_concurrent_catalog(self):
+        catalog_path = os.path.join(self.folder.name, 'concurrent.json')
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            found = list(executor.map(lambda i: SwordModules(self.folder.name, catalog_path).parse_modules(),
+                                      range(8)))
+        self.assertEqual(found, [found[0]] * 8)
+        self.assertFalse([name for name in os.listdir(self.folder.name) if name.endswith('.tmp')])
+
+    def test_workers(self):
+        modules = SwordModules(self.folder.name)
+        self.assertEqual(modules.parse_modules(workers=2), SwordModules(self.folder.name).parse_modules())
+
+    def test_workers_spawn(self):
+        # Spawned processes would run the main module again, so the config files are parsed serially
+        with mock.patch('multiprocessing.get_start_method', return_value='spawn'), \
+                mock.patch('concurrent.futures.ProcessPoolExecutor') as executor:
+            self.assertEqual(SwordModules(self.folder.name).parse_modules(workers=2),
+                             SwordModules(self.folder.name).parse_modules())
+            self.assertFalse(executor.called)
+
+    def test_broken_conf(self):
+        with sword_folder() as folder:
+            build_module(folder, 'ztext')
+            with open(os.path.join(folder, 'mods.d', 'broken.conf'), 'wt') as conf:
+                conf.write('no section header\n')
+            for workers in (None, 2):
+                with contextlib.redirect_stdout(io.StringIO()) as output:
+                    self.assertEqual(list(SwordModules(folder).parse_modules(workers=workers)), ['TestZTEXT'])
+                self.assertIn('Exception while parsing broken.conf', output.getvalue())
+
+
+class TestParallel(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.folder = sword_folder()
+        build_module(cls.folder.name, 'ztext', name='Full', text=text)
+        build_module(cls.folder.name, 'rawtext', name='NTOnly', text=text, testaments=('nt',))
+        build_module(cls.folder.name, 'ztext', name='KJVA', text=kjva_text, versification='kjva')
+        cls.modules = SwordModules(cls.folder.name)
+        cls.modules.parse_modules()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.modules.close()
+        cls.folder.cleanup()
+
+    def test_rows(self):
+        rows = self.modules.get_parallel(('john', 3, [16, 17]), ['Full', 'NTOnly', 'KJVA'])
+        self.assertEqual(rows, [
+            ParallelVerse('John', 3, 16, ['John 3:16', 'John 3:16', 'KJVA John 3:16']),
+            ParallelVerse('John', 3, 17, ['John 3:17', 'John 3:17', 'KJVA John 3:17']),
+        ])
+
+    def test_order(self):
+        rows = self.modules.get_parallel((['gen', 'matt'], 1, [1, 2]), ['NTOnly', 'Full'])
+        self.assertEqual([row[:3] for row in rows],
+                         [('Genesis', 1, 1), ('Genesis', 1, 2), ('Matthew', 1, 1), ('Matthew', 1, 2)])
+        self.assertEqual(rows[0].texts, [None, 'Genesis 1:1'])
+
+    def test_versification(self):
+        rows = self.modules.get_parallel(('tobit', 1, 1), ['Full', 'KJVA'])
+        self.assertEqual(rows, [ParallelVerse('Tobit', 1, 1, [None, 'KJVA Tobit 1:1'])])
+        rows = self.modules.get_parallel((['mal', 'tobit'], 1, 1), ['Full', 'KJVA'])
+        self.assertEqual([row[:3] for row in rows], [('Malachi', 1, 1), ('Tobit', 1, 1)])
+        self.assertRaises(ValueError, self.modules.get_parallel, ('nosuchbook',), ['Full', 'KJVA'])
+
+    def test_duplicate_keys(self):
+        rows = self.modules.get_parallel(('john', 1, 1), ['Full', 'Full'])
+        self.assertEqual(rows, [ParallelVerse('John', 1, 1, ['John 1:1', 'John 1:1'])])
+
+    def test_open_concurrently(self):
+        # Opening one bible does not hold up opening another
+        modules = SwordModules(self.folder.name)
+        modules.parse_modules()
+        barrier = threading.Barrier(2, timeout=5)
+        get_bible_from_module = modules.get_bible_from_module
+
+        def open_bible(module_key):
+            barrier.wait()
+            return get_bible_from_module(module_key)
+        with mock.patch.object(modules, 'get_bible_from_module', side_effect=open_bible) as opened:
+            rows = modules.get_parallel(('john', 1, 1), ['Full', 'NTOnly', 'Full', 'NTOnly'])
+            self.assertEqual(rows, [ParallelVerse('John', 1, 1, ['John 1:1'] * 4)])
+            self.assertEqual(opened.call_count, 2)
+        modules.close()
+
+    def test_pool_reused(self):
+        modules = SwordModules(self.folder.name)
+        modules.parse_modules()
+        with mock.patch('pysword.modules.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as executor:
+            for i in range(3):
+                modules.get_parallel(('john', 1, 1), ['Full', 'KJVA'], workers=1)
+            self.assertEqual(executor.call_count, 1)
+        modules.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
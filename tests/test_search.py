@@ -0,0 +1,208 @@
+###############################################################################
+# PySword - A native Python reader of the SWORD Project Bible Modules         #
+# --------------------------------------------------------------------------- #
+# Copyright (c) 2008-2015 Various developers:                                 #
+# Kenneth Arnold, Joshua Gross, Ryan Hiebert, Matthew Wardrop, Tomas Groth    #
+# --------------------------------------------------------------------------- #
+# This program is free software; you can redistribute it and/or modify it     #
+# under the terms of the GNU General Public License as published by the Free  #
+# Software Foundation; version 2 of the License.                              #
+#                                                                             #
+# This program is distributed in the hope that it will be useful, but WITHOUT #
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or       #
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for    #
+# more details.                                                               #
+#                                                                             #
+# You should have received a copy of the GNU General Public License along     #
+# with this program; if not, write to the Free Software Foundation, Inc., 59  #
+# Temple Place, Suite 330, Boston, MA 02111-1307 USA                          #
+###############################################################################
+
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pysword.bible import SwordBible
+from pysword.search import (_QueryParser, LemmaIndex, SearchIndex, decode_varints, encode_varints, extract_lemmas,
+                            normalize_lemma, strongs_number, tokenize)
+
+from .fixtures import build_module, sword_folder
+
+TEXTS = {
+    ('Genesis', 1, 1): 'In the beginning God created the heaven and the earth.',
+    ('Genesis', 1, 3): 'And God said, Let there be light: and there was light.',
+    ('Genesis', 1, 4): 'And God saw the light, that it was good.',
+    ('Genesis', 1, 6): 'And God said, Let there be a firmament.',
+    ('John', 1, 5): 'And the <w lemma="strong:G5457">light</w> shineth in darkness.',
+}
+
+
+def text(book, chapter, verse):
+    return TEXTS.get((book, chapter, verse), 'verse')
+
+
+class TestVarints(unittest.TestCase):
+
+    def test_round_trip(self):
+        numbers = [0, 1, 127, 128, 300, 16383, 16384, 2 ** 32 + 5]
+        self.assertEqual(decode_varints(encode_varints(numbers)), numbers)
+
+    def test_encoding(self):
+        self.assertEqual(encode_varints([1, 127, 128, 300]), b'\x01\x7f\x80\x01\xac\x02')
+
+
+class TestTokenize(unittest.TestCase):
+
+    def test_markup_and_case(self):
+        self.assertEqual(tokenize('Let <w lemma="strong:H216">Light</w>, be!'), ['let', 'light', 'be'])
+
+
+class TestLemmas(unittest.TestCase):
+
+    def test_strongs_number(self):
+        for lemma in ('strong:H0430', 'strongs:H430', 'h430', 'H430'):
+            self.assertEqual(strongs_number(lemma), 'H430')
+        self.assertEqual(strongs_number('G3588a'), 'G3588a')
+        self.assertIsNone(strongs_number('lemma.TR:theos'))
+
+    def test_normalize_lemma(self):
+        self.assertEqual(normalize_lemma('strong:G0025'), 'G25')
+        self.assertEqual(normalize_lemma('robinson:N-NSM'), 'robinson:N-NSM')
+
+    def test_extract_lemmas(self):
+        self.assertEqual(extract_lemmas('<w lemma="strong:H0430" morph="strongMorph:TH8804">God</w>'),
+                         {'H430', 'strongMorph:TH8804'})
+        self.assertEqual(extract_lemmas('God<WH0430><WTN-NSM>'), {'H430', 'N-NSM'})
+        self.assertEqual(extract_lemmas('<sync type="Strongs" value="G2316" />God'), {'G2316'})
+
+
+class TestQueryParser(unittest.TestCase):
+
+    def parse(self, query):
+        return _QueryParser(query).parse()
+
+    def test_word(self):
+        self.assertEqual(self.parse('Light'), ('phrase', ['light']))
+
+    def test_phrase(self):
+        self.assertEqual(self.parse('"let there be"'), ('phrase', ['let', 'there', 'be']))
+
+    def test_implicit_and(self):
+        self.assertEqual(self.parse('a b AND c'),
+                         ('and', [('phrase', ['a']), ('phrase', ['b']), ('phrase', ['c'])]))
+
+    def test_or(self):
+        self.assertEqual(self.parse('a OR b c'), ('or', [('phrase', ['a']), ('and', [('phrase', ['b']),
+                                                                                     ('phrase', ['c'])])]))
+
+    def test_not(self):
+        self.assertEqual(self.parse('a NOT b'), ('and', [('phrase', ['a']), ('not', ('phrase', ['b']))]))
+
+    def test_minus(self):
+        self.assertEqual(self.parse('a -b'), ('and', [('phrase', ['a']), ('not', ('phrase', ['b']))]))
+
+    def test_minus_phrase(self):
+        self.assertEqual(self.parse('light -"let there be"'),
+                         ('and', [('phrase', ['light']), ('not', ('phrase', ['let', 'there', 'be']))]))
+
+    def test_parentheses(self):
+        self.assertEqual(self.parse('(a OR b) c'),
+                         ('and', [('or', [('phrase', ['a']), ('phrase', ['b'])]), ('phrase', ['c'])]))
+
+    def test_errors(self):
+        for query in ('', '   ', '""', 'a -', 'a "b', '(a OR b', 'a OR b)', 'a OR', '-"..."', '()'):
+            self.assertRaises(ValueError, self.parse, query)
+
+
+class TestSearch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.folder = sword_folder()
+        build_module(cls.folder.name, 'ztext', text=text)
+        cls.bible = SwordBible(os.path.join(cls.folder.name, 'modules', 'texts', 'ztext', 'testztext'),
+                               encoding='utf-8')
+        cls.index_path = os.path.join(cls.folder.name, 'search.index')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.bible.close()
+        cls.folder.cleanup()
+
+    def search(self, query):
+        return self.bible.search(query, self.index_path)
+
+    def test_word(self):
+        self.assertEqual(self.search('light'), [('Genesis', 1, 3), ('Genesis', 1, 4), ('John', 1, 5)])
+
+    def test_phrase(self):
+        self.assertEqual(self.search('"let there be"'), [('Genesis', 1, 3), ('Genesis', 1, 6)])
+        self.assertEqual(self.search('"there be light"'), [('Genesis', 1, 3)])
+        self.assertEqual(self.search('"light there"'), [])
+
+    def test_not(self):
+        self.assertEqual(self.search('light -"let there be"'), [('Genesis', 1, 4), ('John', 1, 5)])
+        self.assertEqual(self.search('light NOT god'), [('John', 1, 5)])
+
+    def test_or(self):
+        self.assertEqual(self.search('firmament OR darkness'), [('Genesis', 1, 6), ('John', 1, 5)])
+
+    def test_only_not(self):
+        self.assertRaises(ValueError, self.search, '-light')
+
+    def test_find_lemma(self):
+        lemma_path = os.path.join(self.folder.name, 'lemma.index')
+        self.assertEqual(self.bible.find_lemma('strong:G05457', lemma_path), [('John', 1, 5)])
+        self.assertEqual(self.bible.find_lemma('H1', lemma_path), [])
+
+    def open_bible(self):
+        return SwordBible(os.path.join(self.folder.name, 'modules', 'texts', 'ztext', 'testztext'), encoding='utf-8')
+
+    def test_concurrent_build(self):
+        index_path = os.path.join(self.folder.name, 'concurrent.index')
+
+        def search(query):
+            with self.open_bible() as bible:
+                return bible.search(query, index_path)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(search, ['firmament'] * 4))
+        self.assertEqual(results, [[('Genesis', 1, 6)]] * 4)
+        self.assertEqual(os.listdir(self.folder.name).count('concurrent.index'), 1)
+        self.assertFalse([name for name in os.listdir(self.folder.name) if name.endswith('.tmp')])
+
+    def test_corrupt_index(self):
+        for index_class, query, expected in ((SearchIndex, 'firmament', [('Genesis', 1, 6)]),
+                                             (LemmaIndex, 'G5457', [('John', 1, 5)])):
+            index_path = os.path.join(self.folder.name, 'corrupt.index')
+            with self.open_bible() as bible:
+                bible.build_search_index(index_path) if index_class is SearchIndex else \
+                    bible.build_lemma_index(index_path)
+            with open(index_path, 'rb') as index_file:
+                data = index_file.read()
+            header_end = 10 + int.from_bytes(data[6:10], 'little')
+            for corrupt in (data[:header_end - 5], data[:-1],
+                            data[:10] + b'[]' + b' ' * (header_end - 12) + data[header_end:],
+                            data[:10] + b'{"ot": {}}' + b' ' * (header_end - 20) + data[header_end:]):
+                with open(index_path, 'wb') as index_file:
+                    index_file.write(corrupt)
+                self.assertEqual(index_class(index_path).testaments(), [])
+                with self.open_bible() as bible:
+                    if index_class is SearchIndex:
+                        self.assertEqual(bible.search(query, index_path), expected)
+                    else:
+                        self.assertEqual(bible.find_lemma(query, index_path), expected)
+            os.unlink(index_path)
+
+    def test_index_reused(self):
+        index_path = os.path.join(self.folder.name, 'reused.index')
+        self.bible.build_search_index(index_path)
+        modified = os.stat(index_path).st_mtime_ns
+        with SwordBible(os.path.join(self.folder.name, 'modules', 'texts', 'ztext', 'testztext'),
+                        encoding='utf-8') as bible:
+            self.assertEqual(bible.search('firmament', index_path), [('Genesis', 1, 6)])
+            self.assertIsInstance(bible.build_search_index(index_path), SearchIndex)
+        self.assertEqual(os.stat(index_path).st_mtime_ns, modified)
+
+
+if __name__ == '__main__':
+    unittest.main()